@@ -4,6 +4,7 @@
 Handles area-based screenshot capture with optional coordinate specification.
 """
 
+import re
 from typing import Optional, Tuple
 
 import click
@@ -20,6 +21,11 @@ from src.services.vision_service import VisionService
 
 logger = get_logger(__name__)
 
+# x,y,width,height: non-negative origin and positive size, compiled once at import
+_COORDS_RE = re.compile(r"\s*(\d+)\s*,\s*(\d+)\s*,\s*0*([1-9]\d*)\s*,\s*0*([1-9]\d*)\s*")
+# Longer input is rejected before matching so a pasted blob never reaches the regex engine
+_MAX_COORDS_LENGTH = 64
+
 
 def parse_coordinates(coords_str: str) -> Tuple[int, int, int, int]:
     """
@@ -32,18 +38,17 @@ def parse_coordinates(coords_str: str) -> Tuple[int, int, int, int]:
         Tuple of (x, y, width, height)
 
     Raises:
-        ValueError: If format is invalid
+        ValueError: If format is invalid, x/y are negative, or width/height are not positive
     """
-    try:
-        parts = coords_str.split(',')
-        if len(parts) != 4:
-            raise ValueError("Coordinates must be in format: x,y,width,height")
-
-        x, y, width, height = map(int, parts)
-        return (x, y, width, height)
-
-    except ValueError as e:
-        raise ValueError(f"Invalid coordinates format: {e}") from e
+    match = _COORDS_RE.fullmatch(coords_str) if len(coords_str) <= _MAX_COORDS_LENGTH else None
+    if match is None:
+        raise ValueError(
+            "Invalid coordinates format: expected x,y,width,height with non-negative x,y "
+            "and positive width,height"
+        )
+
+    x, y, width, height = map(int, match.groups())
+    return (x, y, width, height)
 
 
 @click.command(name='area')
@@ -18,7 +18,7 @@ logger = get_logger(__name__)
 @click.command(name='auto')
 @click.option(
     '--interval',
-    type=int,
+    type=click.IntRange(min=1),
     default=None,
     help='Capture interval in seconds (default: 30 from config)'
 )
@@ -70,11 +70,6 @@ def vision_auto(ctx: click.Context, interval: Optional[int], monitor: int) -> No
             click.echo(click.style("Error: Vision service not initialized", fg='red'))
             raise click.Abort()
 
-        # Validate interval
-        if interval is not None and interval <= 0:
-            click.echo(click.style("Error: Interval must be positive", fg='red'))
-            raise click.Abort()
-
         # Display start message
         interval_text = f"{interval}s" if interval else "default"
         click.echo(click.style("\n🚀 Starting auto-monitoring session...", fg='green', bold=True))
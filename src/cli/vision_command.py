@@ -99,16 +99,11 @@ def get_vision_service() -> VisionService:
             logger.debug(f"Gemini API client not available: {e}")
 
         # Use primary provider as api_client
-        api_client: Optional[IClaudeAPIClient] = None
-        if config.ai_provider.provider.lower() == 'gemini' and gemini_client:
-            api_client = gemini_client
-        elif config.ai_provider.provider.lower() == 'claude' and claude_client:
-            api_client = claude_client
-        elif gemini_client:
-            api_client = gemini_client
-        elif claude_client:
-            api_client = claude_client
-        else:
+        clients = {'claude': claude_client, 'gemini': gemini_client}
+        api_client: Optional[IClaudeAPIClient] = (
+            clients.get(config.ai_provider.provider.lower()) or gemini_client or claude_client
+        )
+        if api_client is None:
             raise VisionCommandError(
                 "No API client configured. Please set either Gemini API key or Claude API key in config.yaml"
             )
@@ -149,15 +144,19 @@ def vision(prompt: str, monitor: Optional[int] = None) -> None:  # noqa: PLR0915
         # Create vision service
         service = get_vision_service()
 
-        # Override monitor if specified
-        if monitor is not None:
-            # Temporarily override the config
-            config = service.config_manager.load_config()
-            config.monitors.default = monitor
-
-        # Execute vision command
-        click.echo("📸 Capturing screenshot...", err=True)
-        response = service.execute_vision_command(prompt)
+        try:
+            # Override monitor if specified
+            if monitor is not None:
+                # Temporarily override the config
+                config = service.config_manager.load_config()
+                config.monitors.default = monitor
+
+            # Execute vision command
+            click.echo("📸 Capturing screenshot...", err=True)
+            response = service.execute_vision_command(prompt)
+        finally:
+            # Release the service's background worker before exiting
+            service.close()
 
         # Output response
         click.echo("\n" + "="*60)
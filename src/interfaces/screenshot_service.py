@@ -211,6 +211,15 @@ class IClaudeAPIClient(ABC):
         """
         pass
 
+    def warm_connection(self) -> None:  # noqa: B027 - optional hook with a no-op default
+        """
+        Pre-establish the connection to the API endpoint.
+
+        Optional hook called while the screenshot is still being processed.
+        Implementations without connection reuse keep this default no-op.
+        Must never raise.
+        """
+
 
 class IConfigurationManager(ABC):
     """Interface for configuration management."""
@@ -38,14 +38,39 @@ class CaptureRegion:
         Raises:
             ValueError: If coordinates are invalid or out of bounds
         """
-        if self.x < 0 or self.y < 0:
-            raise ValueError("Coordinates must be non-negative")
-        if self.width <= 0 or self.height <= 0:
-            raise ValueError("Dimensions must be positive")
-        if self.x + self.width > monitor_width:
-            raise ValueError(f"Region exceeds monitor width ({monitor_width})")
-        if self.y + self.height > monitor_height:
-            raise ValueError(f"Region exceeds monitor height ({monitor_height})")
+        error = self.validate_raw(
+            self.x, self.y, self.width, self.height, monitor_width=monitor_width, monitor_height=monitor_height
+        )
+        if error is not None:
+            raise ValueError(error)
+
+    @staticmethod
+    def validate_raw(
+        x: int, y: int, width: int, height: int, *, monitor_width: int, monitor_height: int
+    ) -> Optional[str]:
+        """
+        Check region bounds from raw integers without building a CaptureRegion.
+
+        Args:
+            x: Left edge in pixels
+            y: Top edge in pixels
+            width: Region width in pixels
+            height: Region height in pixels
+            monitor_width: Width of the monitor in pixels
+            monitor_height: Height of the monitor in pixels
+
+        Returns:
+            Error message describing the first violated constraint, or None if the region is valid
+        """
+        if x < 0 or y < 0:
+            return "Coordinates must be non-negative"
+        if width <= 0 or height <= 0:
+            return "Dimensions must be positive"
+        if x + width > monitor_width:
+            return f"Region exceeds monitor width ({monitor_width})"
+        if y + height > monitor_height:
+            return f"Region exceeds monitor height ({monitor_height})"
+        return None
 
 
 @dataclass
@@ -159,6 +184,10 @@ class AIProviderConfig:
     provider: str = "gemini"  # 'claude' or 'gemini'
     fallback_to_gemini: bool = True
 
+    def __post_init__(self) -> None:
+        """Normalize provider name so lookups can compare it directly."""
+        self.provider = self.provider.lower()
+
 
 @dataclass
 class ClaudeCodeConfig:
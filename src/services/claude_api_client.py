@@ -12,11 +12,17 @@ Implements IClaudeAPIClient interface.
 
 import base64
 import json
+import mmap
 from pathlib import Path
 from typing import Any, Dict, Optional, cast
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 from src.interfaces.screenshot_service import IClaudeAPIClient
 from src.lib.exceptions import APIError, AuthenticationError, OAuthConfigNotFoundError, PayloadTooLargeError
 from src.lib.logging_config import get_logger
@@ -25,6 +31,24 @@ from src.models.entities import Screenshot
 logger = get_logger(__name__)
 
 
+def _dumps_payload(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a request payload to JSON bytes.
+
+    Uses orjson when installed, which is much faster on the multi-megabyte
+    base64 image field; falls back to the standard library otherwise.
+
+    Args:
+        payload: Request body
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
 class AnthropicAPIClient(IClaudeAPIClient):
     """
     Anthropic API client for sending multimodal prompts to Claude.
@@ -35,6 +59,7 @@ class AnthropicAPIClient(IClaudeAPIClient):
     DEFAULT_OAUTH_PATH = Path.home() / ".claude" / "config.json"
     DEFAULT_API_ENDPOINT = "https://api.anthropic.com/v1/messages"
     MAX_IMAGE_SIZE_MB = 5.0  # Anthropic API limit
+    WARM_TIMEOUT_SECONDS = 1.0  # requests timeout for the warm-up HEAD (does not cover DNS)
 
     def __init__(
         self,
@@ -53,6 +78,8 @@ class AnthropicAPIClient(IClaudeAPIClient):
         self.oauth_token_path = Path(oauth_token_path).expanduser() if oauth_token_path else self.DEFAULT_OAUTH_PATH
         self.api_endpoint = api_endpoint or self.DEFAULT_API_ENDPOINT
         self._api_key = api_key  # Cache for API key
+        self._session = requests.Session()  # Pooled connection reused across requests
+        self._connection_warmed = False  # Set once a warm-up succeeds; the pool then keeps the connection
 
         logger.debug(f"AnthropicAPIClient initialized: endpoint={self.api_endpoint}")
 
@@ -113,7 +140,7 @@ class AnthropicAPIClient(IClaudeAPIClient):
                     "content-type": "application/json"
                 }
 
-            payload = {
+            payload: Dict[str, Any] = {
                 "model": "claude-3-5-sonnet-20241022",  # Latest model with vision
                 "max_tokens": 4096,
                 "messages": messages
@@ -121,10 +148,10 @@ class AnthropicAPIClient(IClaudeAPIClient):
 
             # Send request
             logger.debug(f"Sending request to {self.api_endpoint}")
-            response = requests.post(
+            response = self._session.post(
                 self.api_endpoint,
                 headers=headers,
-                json=payload,
+                data=_dumps_payload(payload),
                 timeout=60
             )
 
@@ -158,6 +185,22 @@ class AnthropicAPIClient(IClaudeAPIClient):
         except json.JSONDecodeError as e:
             raise APIError(f"Failed to parse API response: {e}") from e
 
+    def warm_connection(self) -> None:
+        """
+        Open the pooled connection (DNS + TCP + TLS) ahead of the real request.
+
+        Skipped after the first successful warm-up. Failures are logged and
+        ignored; the subsequent POST connects normally.
+        """
+        if self._connection_warmed:
+            return
+        try:
+            self._session.head(self.api_endpoint, timeout=self.WARM_TIMEOUT_SECONDS)
+            self._connection_warmed = True
+            logger.debug(f"Connection to {self.api_endpoint} warmed")
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Connection warm-up failed: {e}")
+
     def validate_oauth_token(self) -> bool:
         """
         Check if OAuth token is valid.
@@ -280,10 +323,9 @@ class AnthropicAPIClient(IClaudeAPIClient):
             APIError: If encoding fails
         """
         try:
-            with open(screenshot.file_path, 'rb') as f:
-                image_bytes = f.read()
-
-            encoded = base64.standard_b64encode(image_bytes).decode('utf-8')
+            # Map the file instead of reading it, avoiding one full copy of the image
+            with open(screenshot.file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                encoded = base64.standard_b64encode(mm).decode('ascii')
 
             logger.debug(f"Image encoded to base64: {len(encoded)} chars")
             return encoded
@@ -5,8 +5,9 @@ Handles loading, saving, and validating configuration from YAML file.
 Implements IConfigurationManager interface.
 """
 
+import copy
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import yaml
 
@@ -17,6 +18,10 @@ from src.models.entities import Configuration
 
 logger = get_logger(__name__)
 
+# libyaml-backed C loader/dumper when PyYAML was built with it; the pure-Python classes otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class ConfigurationManager(IConfigurationManager):
     """
@@ -35,6 +40,8 @@ class ConfigurationManager(IConfigurationManager):
             config_path: Path to config file. If None, uses default location.
         """
         self.config_path = config_path or self.DEFAULT_CONFIG_PATH
+        # (st_mtime_ns, st_size) of the file the cached Configuration was parsed from or saved to
+        self._cache: Optional[Tuple[Tuple[int, int], Configuration]] = None
         logger.debug(f"ConfigurationManager initialized with path: {self.config_path}")
 
     def load_config(self) -> Configuration:
@@ -48,13 +55,19 @@ class ConfigurationManager(IConfigurationManager):
             ConfigurationError: If config invalid
         """
         # If config file doesn't exist, return defaults
-        if not self.config_path.exists():
+        file_key = self._file_key()
+        if file_key is None:
             logger.info(f"Config file not found at {self.config_path}, using defaults")
             return Configuration()
 
+        # Unchanged file: hand out a copy of the last parse so callers may mutate it freely
+        if self._cache is not None and self._cache[0] == file_key:
+            logger.debug(f"Configuration served from cache for {self.config_path}")
+            return copy.deepcopy(self._cache[1])
+
         try:
             with open(self.config_path, encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YAML_LOADER)
 
             if not data:
                 logger.warning(f"Empty config file at {self.config_path}, using defaults")
@@ -66,6 +79,7 @@ class ConfigurationManager(IConfigurationManager):
             # Validate
             self.validate_config(config)
 
+            self._cache = (file_key, copy.deepcopy(config))
             logger.info(f"Configuration loaded successfully from {self.config_path}")
             return config
 
@@ -96,13 +110,25 @@ class ConfigurationManager(IConfigurationManager):
 
             # Write YAML
             with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(config_dict, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
+
+            file_key = self._file_key()
+            self._cache = (file_key, copy.deepcopy(config)) if file_key is not None else None
 
             logger.info(f"Configuration saved successfully to {self.config_path}")
 
         except Exception as e:
             raise ConfigurationError(f"Failed to save configuration: {e}") from e
 
+    def clear_cache(self) -> None:
+        """
+        Drop the cached Configuration so the next load_config() re-reads the file.
+
+        Needed only when the file may have been rewritten without changing its
+        modification time or size.
+        """
+        self._cache = None
+
     def validate_config(self, config: Configuration) -> bool:
         """
         Validate configuration against schema.
@@ -139,6 +165,10 @@ class ConfigurationManager(IConfigurationManager):
         if config.logging.level not in ['DEBUG', 'INFO', 'WARNING', 'ERROR']:
             errors.append("logging.level must be DEBUG, INFO, WARNING, or ERROR")
 
+        # Validate AI provider settings
+        if config.ai_provider.provider.lower() not in ['claude', 'gemini']:
+            errors.append("ai_provider.provider must be 'claude' or 'gemini'")
+
         # Validate privacy zones
         for zone in config.privacy.zones:
             if zone.x < 0 or zone.y < 0:
@@ -253,7 +283,7 @@ class ConfigurationManager(IConfigurationManager):
         if 'ai_provider' in data:
             ap = data['ai_provider']
             if 'provider' in ap:
-                config.ai_provider.provider = ap['provider']
+                config.ai_provider.provider = str(ap['provider']).lower()
             if 'fallback_to_gemini' in ap:
                 config.ai_provider.fallback_to_gemini = ap['fallback_to_gemini']
 
@@ -266,6 +296,19 @@ class ConfigurationManager(IConfigurationManager):
 
         return config
 
+    def _file_key(self) -> Optional[Tuple[int, int]]:
+        """
+        Identify the current on-disk version of the config file.
+
+        Returns:
+            (modification time in ns, size in bytes), or None if the file does not exist
+        """
+        try:
+            st = self.config_path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def _config_to_dict(self, config: Configuration) -> dict:
         """
         Convert Configuration object to dictionary for YAML serialization.
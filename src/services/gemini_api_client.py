@@ -249,7 +249,7 @@ class GeminiAPIClient(IClaudeAPIClient):
 
             if self.DEFAULT_CONFIG_PATH.exists():
                 with open(self.DEFAULT_CONFIG_PATH) as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
                 # Look for gemini API key in config
                 if config and 'gemini' in config:
@@ -10,7 +10,7 @@ import subprocess
 import threading
 import time
 from datetime import datetime, timezone
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 from uuid import UUID, uuid4
 
 from src.interfaces.screenshot_service import (
@@ -41,6 +41,10 @@ class MonitoringSessionManager(IMonitoringSessionManager):
     - Single active session enforcement
     """
 
+    # Longest an xprintidle reading is reused; a paused loop polls idle state every second.
+    # Sessions shorter than twice this cache for half their interval instead.
+    IDLE_QUERY_CACHE_SECONDS = 5.0
+
     def __init__(
         self,
         config_manager: IConfigurationManager,
@@ -48,7 +52,10 @@ class MonitoringSessionManager(IMonitoringSessionManager):
         capture: IScreenshotCapture,
         processor: IImageProcessor,
         api_client: IClaudeAPIClient,
-        idle_seconds_provider: Optional[Callable[[], Optional[float]]] = None
+        idle_seconds_provider: Optional[Callable[[], Optional[float]]] = None,
+        *,
+        sleep_fn: Optional[Callable[[float], None]] = None,
+        clock: Optional[Callable[[], float]] = None
     ):
         """
         Initialize MonitoringSessionManager.
@@ -59,7 +66,10 @@ class MonitoringSessionManager(IMonitoringSessionManager):
             capture: Screenshot capture implementation
             processor: Image processor
             api_client: Claude API client
-            idle_seconds_provider: Optional idle detector callback for testability
+            idle_seconds_provider: Optional idle detector callback for testability; called on
+                every check, whereas the default system query is cached (see _idle_cache_ttl)
+            sleep_fn: Optional replacement for time.sleep in the capture loop, for testability
+            clock: Optional replacement for time.monotonic when timing max duration, for testability
         """
         self.config_manager = config_manager
         self.temp_manager = temp_manager
@@ -71,7 +81,10 @@ class MonitoringSessionManager(IMonitoringSessionManager):
         self._capture_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
-        self._idle_seconds_provider = idle_seconds_provider or self._get_system_idle_seconds
+        self._sleep_fn = sleep_fn or time.sleep
+        self._clock = clock or time.monotonic
+        self._idle_seconds_provider = idle_seconds_provider or self._get_cached_system_idle_seconds
+        self._idle_cache: Optional[Tuple[float, Optional[float]]] = None
 
         logger.info("MonitoringSessionManager initialized")
 
@@ -133,7 +146,7 @@ class MonitoringSessionManager(IMonitoringSessionManager):
             )
             self._capture_thread.start()
 
-            logger.info(f"Monitoring session started: {session.id} (interval={interval_seconds}s)")
+            logger.info("Monitoring session started: %s (interval=%ss)", session.id, interval_seconds)
             return session
 
     def stop_session(self, session_id: UUID) -> None:
@@ -156,7 +169,7 @@ class MonitoringSessionManager(IMonitoringSessionManager):
             # Signal thread to stop
             self._stop_event.set()
 
-            logger.info(f"Stopping monitoring session: {session_id}")
+            logger.info("Stopping monitoring session: %s", session_id)
 
         # Wait for thread to finish (outside lock to avoid deadlock)
         if self._capture_thread and self._capture_thread.is_alive():
@@ -164,8 +177,9 @@ class MonitoringSessionManager(IMonitoringSessionManager):
 
         with self._lock:
             logger.info(
-                f"Monitoring session stopped: {session_id} "
-                f"(captures={self._active_session.capture_count})"
+                "Monitoring session stopped: %s (captures=%d)",
+                session_id,
+                self._active_session.capture_count
             )
             self._active_session = None
             self._capture_thread = None
@@ -186,9 +200,9 @@ class MonitoringSessionManager(IMonitoringSessionManager):
 
             if self._active_session.paused_at is None:
                 self._active_session.paused_at = datetime.now(timezone.utc)
-                logger.info(f"Monitoring session paused: {session_id}")
+                logger.info("Monitoring session paused: %s", session_id)
             else:
-                logger.debug(f"Session {session_id} already paused")
+                logger.debug("Session %s already paused", session_id)
 
     def resume_session(self, session_id: UUID) -> None:
         """
@@ -206,9 +220,9 @@ class MonitoringSessionManager(IMonitoringSessionManager):
 
             if self._active_session.paused_at is not None:
                 self._active_session.paused_at = None
-                logger.info(f"Monitoring session resumed: {session_id}")
+                logger.info("Monitoring session resumed: %s", session_id)
             else:
-                logger.debug(f"Session {session_id} not paused")
+                logger.debug("Session %s not paused", session_id)
 
     def get_active_session(self) -> Optional[MonitoringSession]:
         """
@@ -233,7 +247,8 @@ class MonitoringSessionManager(IMonitoringSessionManager):
         idle_pause_minutes = config.monitoring.idle_pause_minutes
         change_detection_enabled = config.monitoring.change_detection
 
-        session_start = datetime.now(timezone.utc)
+        # Monotonic: immune to wall-clock jumps, and no datetime built per iteration
+        session_start = self._clock()
 
         try:
             while not self._stop_event.is_set():
@@ -243,11 +258,11 @@ class MonitoringSessionManager(IMonitoringSessionManager):
 
                     # Check max duration
                     if max_duration_minutes > 0:
-                        elapsed = (datetime.now(timezone.utc) - session_start).total_seconds() / 60
+                        elapsed = (self._clock() - session_start) / 60
                         if elapsed >= max_duration_minutes:
                             logger.info(
-                                f"Max duration reached ({max_duration_minutes} min), "
-                                "stopping session"
+                                "Max duration reached (%s min), stopping session",
+                                max_duration_minutes
                             )
                             self._active_session.is_active = False
                             self._stop_event.set()
@@ -257,22 +272,22 @@ class MonitoringSessionManager(IMonitoringSessionManager):
                     self._maybe_update_idle_pause(idle_pause_minutes)
                     if self._active_session.paused_at is not None:
                         # Session is paused, skip capture
-                        time.sleep(1)
+                        self._sleep_fn(1)
                         continue
 
                     # Perform capture
                     try:
                         self._perform_capture(change_detection_enabled)
                     except Exception as e:
-                        logger.error(f"Capture failed: {e}", exc_info=True)
+                        logger.error("Capture failed: %s", e, exc_info=True)
                         # Continue monitoring despite error
 
                 # Sleep for interval
                 interval = self._active_session.interval_seconds if self._active_session else 30
-                time.sleep(interval)
+                self._sleep_fn(interval)
 
         except Exception as e:
-            logger.error(f"Capture loop failed: {e}", exc_info=True)
+            logger.error("Capture loop failed: %s", e, exc_info=True)
         finally:
             logger.info("Capture loop stopped")
 
@@ -322,10 +337,8 @@ class MonitoringSessionManager(IMonitoringSessionManager):
             prompt = f"[Auto-monitoring capture #{session.capture_count + 1}]"
             response = self.api_client.send_multimodal_prompt(prompt, screenshot)
 
-            logger.info(
-                f"Auto-capture #{session.capture_count + 1} completed: "
-                f"{len(response)} chars received"
-            )
+            logger.info("Auto-capture #%d completed", session.capture_count + 1)
+            logger.debug("Auto-capture response: %d chars received", len(response))
 
             # Update session stats
             session.capture_count += 1
@@ -335,7 +348,7 @@ class MonitoringSessionManager(IMonitoringSessionManager):
             self.temp_manager.cleanup_temp_file(screenshot.file_path)
 
         except Exception as e:
-            logger.error(f"Capture failed: {e}", exc_info=True)
+            logger.error("Capture failed: %s", e, exc_info=True)
             raise
 
     def _maybe_update_idle_pause(self, idle_pause_minutes: int) -> None:
@@ -352,19 +365,48 @@ class MonitoringSessionManager(IMonitoringSessionManager):
         if idle_seconds is None:
             return
 
-        idle_threshold_seconds = idle_pause_minutes * 60
-        is_paused = self._active_session.paused_at is not None
+        session = self._active_session
+        should_pause = idle_seconds >= idle_pause_minutes * 60
+        if should_pause == (session.paused_at is not None):
+            return
 
-        if idle_seconds >= idle_threshold_seconds and not is_paused:
-            self._active_session.paused_at = datetime.now(timezone.utc)
-            logger.info(
-                "Monitoring session auto-paused due to idle timeout "
-                f"({idle_pause_minutes} min)"
-            )
-        elif idle_seconds < idle_threshold_seconds and is_paused:
-            self._active_session.paused_at = None
+        # State changes only here, so the clock is read once per pause rather than per check
+        session.paused_at = datetime.now(timezone.utc) if should_pause else None
+        if should_pause:
+            logger.info("Monitoring session auto-paused due to idle timeout (%s min)", idle_pause_minutes)
+        else:
             logger.info("Monitoring session auto-resumed after activity detected")
 
+    def _idle_cache_ttl(self) -> float:
+        """
+        Get how long a system idle reading may be reused.
+
+        Capped at half the session interval so each capture decision sees a
+        reading taken since the previous capture.
+
+        Returns:
+            Cache lifetime in seconds
+        """
+        session = self._active_session
+        if session is None:
+            return self.IDLE_QUERY_CACHE_SECONDS
+        return min(self.IDLE_QUERY_CACHE_SECONDS, session.interval_seconds / 2)
+
+    def _get_cached_system_idle_seconds(self) -> Optional[float]:
+        """
+        Get system idle time, reusing a reading younger than _idle_cache_ttl().
+
+        Returns:
+            Idle duration in seconds, or None when unavailable.
+        """
+        now = self._clock()
+        if self._idle_cache is not None and now - self._idle_cache[0] < self._idle_cache_ttl():
+            return self._idle_cache[1]
+
+        idle_seconds = self._get_system_idle_seconds()
+        self._idle_cache = (now, idle_seconds)
+        return idle_seconds
+
     def _get_system_idle_seconds(self) -> Optional[float]:
         """
         Get system idle time in seconds.
@@ -6,9 +6,16 @@ Composes all other services to implement user-facing commands.
 Implements IVisionService interface.
 """
 
-from typing import Optional
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, TextIO, Tuple
 from uuid import UUID
 
+from click import confirm as _confirm
+
 from src.interfaces.screenshot_service import (
     IClaudeAPIClient,
     IConfigurationManager,
@@ -19,12 +26,54 @@ from src.interfaces.screenshot_service import (
     ITempFileManager,
     IVisionService,
 )
-from src.lib.exceptions import SessionAlreadyActiveError, VisionCommandError
+from src.lib.exceptions import SessionAlreadyActiveError, VisionCommandError, VisionError
 from src.lib.logging_config import get_logger
 from src.models.entities import CaptureRegion
 
 logger = get_logger(__name__)
 
+PRIVACY_NOTICE = "\n".join([
+    "\n" + "=" * 80,
+    "CLAUDE CODE VISION - PRIVACY NOTICE",
+    "=" * 80,
+    "\nThis tool will:",
+    "  • Capture screenshots of your screen",
+    "  • Transmit screenshots to Claude API for analysis",
+    "  • Immediately delete screenshots after transmission",
+    "  • Never store screenshots permanently",
+    "\nPrivacy protection:",
+    "  • You can configure privacy zones to redact sensitive areas",
+    "  • Privacy zones are black rectangles applied BEFORE transmission",
+    "  • Use --add-privacy-zone command to configure redaction zones",
+    "\n" + "=" * 80,
+]) + "\n"
+
+
+@contextmanager
+def _vision_error_boundary(failure_message: str) -> Iterator[None]:
+    """
+    Convert expected command failures into VisionCommandError.
+
+    Only domain errors (VisionError subclasses such as APIError or
+    ScreenshotCaptureError) and OSError are wrapped. VisionCommandError
+    propagates unchanged instead of being wrapped a second time, and anything
+    else (TypeError, AttributeError, KeyboardInterrupt, ...) is a bug or an
+    interrupt and propagates as-is.
+
+    Args:
+        failure_message: Prefix for the wrapped error, e.g. "Failed to execute vision command"
+
+    Raises:
+        VisionCommandError: If the block raises a VisionError or OSError
+    """
+    try:
+        yield
+    except VisionCommandError:
+        raise
+    except (VisionError, OSError) as e:
+        logger.error("%s: %s", failure_message, e)
+        raise VisionCommandError(f"{failure_message}: {e}") from e
+
 
 class VisionService(IVisionService):
     """
@@ -38,6 +87,9 @@ class VisionService(IVisionService):
     - Monitoring sessions
     """
 
+    PRIVACY_SENTINEL_NAME = ".privacy_accepted"
+    WARM_WAIT_SECONDS = 1.0  # Longest a send waits on the warm-up before connecting on its own
+
     def __init__(
         self,
         config_manager: IConfigurationManager,
@@ -47,7 +99,9 @@ class VisionService(IVisionService):
         api_client: IClaudeAPIClient,
         region_selector: Optional[IRegionSelector] = None,
         session_manager: Optional[IMonitoringSessionManager] = None,
-        gemini_client: Optional[IClaudeAPIClient] = None
+        gemini_client: Optional[IClaudeAPIClient] = None,
+        *,
+        privacy_sentinel_path: Optional[Path] = None
     ):
         """
         Initialize VisionService.
@@ -61,6 +115,9 @@ class VisionService(IVisionService):
             region_selector: Region selector for area selection (optional)
             session_manager: Monitoring session manager (optional)
             gemini_client: Gemini API client for fallback (optional)
+            privacy_sentinel_path: Marker file recording privacy acceptance (default: next to
+                the config manager's config_path; without either, acceptance lasts for this
+                service only)
         """
         self.config_manager = config_manager
         self.temp_manager = temp_manager
@@ -70,6 +127,19 @@ class VisionService(IVisionService):
         self.gemini_client = gemini_client
         self.region_selector = region_selector
         self.session_manager = session_manager
+        config_path = getattr(config_manager, 'config_path', None)
+        if privacy_sentinel_path is None and isinstance(config_path, (str, Path)):
+            privacy_sentinel_path = Path(config_path).parent / self.PRIVACY_SENTINEL_NAME
+        self.privacy_sentinel_path: Optional[Path] = privacy_sentinel_path
+        self._privacy_accepted_in_session = False
+
+        # Provider decision cached as ((provider, fallback_enabled), client). Nothing clears it
+        # explicitly: a changed provider setting produces a different key and reruns selection.
+        self._cached_client: Optional[Tuple[Tuple[str, bool], IClaudeAPIClient]] = None
+
+        # Background workers for overlapping network setup with image processing; created on
+        # first warm-up so commands that never send (auto, stop) start no threads
+        self._executor: Optional[ThreadPoolExecutor] = None
 
         logger.info("VisionService initialized")
 
@@ -84,24 +154,53 @@ class VisionService(IVisionService):
             VisionCommandError: If no valid API client available
         """
         config = self.config_manager.load_config()
-        provider = config.ai_provider.provider.lower()
+        provider = config.ai_provider.provider
+        cache_key = (provider, config.ai_provider.fallback_to_gemini)
+
+        # Reuse the previous decision while provider settings are unchanged
+        if self._cached_client is not None and self._cached_client[0] == cache_key:
+            return self._cached_client[1]
+
+        client = self._select_api_client(provider, config.ai_provider.fallback_to_gemini)
+        self._cached_client = (cache_key, client)
+        return client
+
+    def _select_api_client(self, provider: str, fallback_enabled: bool) -> IClaudeAPIClient:
+        """
+        Run the provider-selection chain.
+
+        Only runs when the cached decision in _get_api_client misses, so the
+        case normalization here is not repeated on every monitoring tick.
+
+        Args:
+            provider: Provider name ('claude' or 'gemini', any case)
+            fallback_enabled: Whether falling back to the other provider is allowed
+
+        Returns:
+            API client to use (Claude or Gemini)
+
+        Raises:
+            VisionCommandError: If no valid API client available
+        """
+        # Normalized here as well as at load: the config may be edited after loading
+        provider = provider.lower()
+        clients = {'claude': self.claude_client, 'gemini': self.gemini_client}
 
         # Try primary provider
-        if provider == 'gemini' and self.gemini_client:
-            logger.info("Using Gemini API as primary provider")
-            return self.gemini_client
-        if provider == 'claude' and self.claude_client:
-            logger.info("Using Claude API as primary provider")
-            return self.claude_client
+        primary = clients.get(provider)
+        if primary:
+            logger.info("Using %s API as primary provider", provider.capitalize())
+            return primary
 
         # Try fallback if enabled
-        if config.ai_provider.fallback_to_gemini:
-            if provider == 'claude' and self.gemini_client:
-                logger.warning("Claude API not available, falling back to Gemini")
-                return self.gemini_client
-            if provider == 'gemini' and self.claude_client:
-                logger.warning("Gemini API not available, falling back to Claude")
-                return self.claude_client
+        if fallback_enabled and provider in clients:
+            fallback_name = 'gemini' if provider == 'claude' else 'claude'
+            fallback = clients[fallback_name]
+            if fallback:
+                logger.warning(
+                    "%s API not available, falling back to %s", provider.capitalize(), fallback_name.capitalize()
+                )
+                return fallback
 
         # No valid client available
         raise VisionCommandError(
@@ -109,52 +208,112 @@ class VisionService(IVisionService):
             f"Please configure API key in config.yaml"
         )
 
-    def _check_first_use_prompt(self) -> bool:
+    def _start_warm_connection(self) -> Optional[Future]:
+        """
+        Start warming the API connection in the background.
+
+        Client selection errors are not raised here; they surface when the
+        client is resolved before sending.
+
+        Returns:
+            Future of the warm-up, or None if no client is available
+        """
+        try:
+            api_client = self._get_api_client()
+        except VisionCommandError:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="VisionService")
+        return self._executor.submit(api_client.warm_connection)
+
+    def _wait_for_warm_connection(self, future: Optional[Future]) -> None:
+        """
+        Wait up to WARM_WAIT_SECONDS for a connection warm-up to finish.
+
+        The client's own timeout does not cover DNS resolution, so the wait is
+        bounded here. On timeout the request goes ahead without the warmed
+        connection; the pool hands it a separate connection from the one the
+        unfinished warm-up holds.
+
+        Args:
+            future: Future returned by _start_warm_connection, or None
+        """
+        if future is None:
+            return
+        try:
+            future.result(timeout=self.WARM_WAIT_SECONDS)
+        except FutureTimeoutError:
+            logger.debug("Connection warm-up still running after %ss, sending without it", self.WARM_WAIT_SECONDS)
+        except Exception as e:
+            logger.debug("Connection warm-up failed: %s", e)
+
+    def close(self) -> None:
+        """
+        Shut down the background worker, if one was started.
+
+        Does not wait for a stalled warm-up; its result is no longer needed.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _check_first_use_prompt(self, out: Optional[TextIO] = None) -> bool:
         """
         Check if first-use privacy prompt should be shown and handle user response.
 
+        Args:
+            out: Stream for the privacy notice (default: sys.stdout at call time)
+
         Returns:
             True if user accepts, False if user declines
 
         Raises:
             VisionCommandError: If user declines privacy prompt
         """
+        # Prompt disabled in config (including acceptance recorded by older versions)
         config = self.config_manager.load_config()
-
-        # Check if prompt needed
         if not config.privacy.prompt_first_use:
             return True
 
+        if self._privacy_accepted():
+            return True
+
         logger.info("First-use privacy prompt required")
 
-        # Display privacy information
-        print("\n" + "="*80)
-        print("CLAUDE CODE VISION - PRIVACY NOTICE")
-        print("="*80)
-        print("\nThis tool will:")
-        print("  • Capture screenshots of your screen")
-        print("  • Transmit screenshots to Claude API for analysis")
-        print("  • Immediately delete screenshots after transmission")
-        print("  • Never store screenshots permanently")
-        print("\nPrivacy protection:")
-        print("  • You can configure privacy zones to redact sensitive areas")
-        print("  • Privacy zones are black rectangles applied BEFORE transmission")
-        print("  • Use --add-privacy-zone command to configure redaction zones")
-        print("\n" + "="*80)
+        # Display privacy information in one write rather than a print() per line
+        (out or sys.stdout).write(PRIVACY_NOTICE)
 
         # Get user confirmation
-        import click
-        if not click.confirm("\nDo you understand and accept these privacy terms?", default=True):
+        if not _confirm("\nDo you understand and accept these privacy terms?", default=True):
             logger.info("User declined privacy terms")
             raise VisionCommandError("Privacy terms not accepted. Vision command cancelled.")
 
-        # Update config to disable future prompts
-        config.privacy.prompt_first_use = False
-        self.config_manager.save_config(config)
+        # Record acceptance without rewriting config.yaml
+        self._privacy_accepted_in_session = True
+        if self.privacy_sentinel_path is not None:
+            try:
+                self.privacy_sentinel_path.parent.mkdir(parents=True, exist_ok=True)
+                self.privacy_sentinel_path.touch()
+            except OSError as e:
+                logger.warning("Could not record privacy acceptance at %s: %s", self.privacy_sentinel_path, e)
         logger.info("First-use prompt accepted and disabled")
 
         return True
 
+    def _privacy_accepted(self) -> bool:
+        """
+        Check whether privacy acceptance has been recorded.
+
+        Acceptance is permanent: later config saves (adding a privacy zone,
+        re-running init) do not bring the prompt back.
+
+        Returns:
+            True if accepted in this service or the sentinel file exists
+        """
+        if self._privacy_accepted_in_session:
+            return True
+        return self.privacy_sentinel_path is not None and self.privacy_sentinel_path.exists()
+
     def execute_vision_command(self, prompt: str) -> str:
         """
         Execute /vision command: capture full screen + send to Claude.
@@ -168,7 +327,7 @@ class VisionService(IVisionService):
         Workflow:
             0. Check first-use privacy prompt (FR-013)
             1. Capture full screen
-            2. Apply privacy zones (if configured)
+            2. Apply privacy zones (if configured), warming the API connection meanwhile
             3. Optimize image
             4. Send to Claude API
             5. Cleanup temp files
@@ -177,9 +336,10 @@ class VisionService(IVisionService):
         Raises:
             VisionCommandError: If any step fails
         """
-        logger.info(f"Executing /vision command: prompt length={len(prompt)}")
+        logger.info("Executing /vision command")
+        logger.debug("Prompt length=%d", len(prompt))
 
-        try:
+        with _vision_error_boundary("Failed to execute vision command"):
             # Step 0: First-use privacy prompt
             self._check_first_use_prompt()
 
@@ -189,25 +349,29 @@ class VisionService(IVisionService):
             # Step 1: Capture full screen
             logger.info("Step 1/5: Capturing full screen")
             screenshot = self.capture.capture_full_screen(monitor=config.monitors.default)
-            logger.info(f"Screenshot captured: {screenshot.id}")
+            logger.info("Screenshot captured: %s", screenshot.id)
+
+            # Warm the API connection while the image is processed
+            warm_future = self._start_warm_connection()
 
             # Step 2: Apply privacy zones (if configured)
             if config.privacy.enabled and config.privacy.zones:
-                logger.info(f"Step 2/5: Applying {len(config.privacy.zones)} privacy zone(s)")
+                logger.info("Step 2/5: Applying %d privacy zone(s)", len(config.privacy.zones))
                 screenshot = self.processor.apply_privacy_zones(screenshot, config.privacy.zones)
             else:
                 logger.info("Step 2/5: Privacy zones disabled, skipping")
 
             # Step 3: Optimize image
-            logger.info(f"Step 3/5: Optimizing image (max {config.screenshot.max_size_mb} MB)")
+            logger.info("Step 3/5: Optimizing image (max %s MB)", config.screenshot.max_size_mb)
             screenshot = self.processor.optimize_image(screenshot, config.screenshot.max_size_mb)
-            logger.info(f"Image optimized: {screenshot.optimized_size_bytes / (1024*1024):.2f} MB")
+            logger.info("Image optimized: %.2f MB", screenshot.optimized_size_bytes / (1024 * 1024))
 
             # Step 4: Send to AI API (Claude or Gemini)
             api_client = self._get_api_client()
+            self._wait_for_warm_connection(warm_future)
             logger.info("Step 4/5: Sending to AI API")
             response = api_client.send_multimodal_prompt(prompt, screenshot)
-            logger.info(f"Response received: {len(response)} chars")
+            logger.debug("Response received: %d chars", len(response))
 
             # Step 5: Cleanup temp files
             logger.info("Step 5/5: Cleaning up temp files")
@@ -216,10 +380,6 @@ class VisionService(IVisionService):
             logger.info("Vision command completed successfully")
             return response
 
-        except Exception as e:
-            logger.error(f"Vision command failed: {e}")
-            raise VisionCommandError(f"Failed to execute vision command: {e}") from e
-
     def execute_vision_area_command(self, prompt: str, region: Optional[CaptureRegion] = None) -> str:
         """
         Execute /vision.area command: capture region + send to Claude.
@@ -243,9 +403,10 @@ class VisionService(IVisionService):
         Raises:
             VisionCommandError: If any step fails
         """
-        logger.info(f"Executing /vision.area command: prompt length={len(prompt)}")
+        logger.info("Executing /vision.area command")
+        logger.debug("Prompt length=%d", len(prompt))
 
-        try:
+        with _vision_error_boundary("Failed to execute vision area command"):
             # Load configuration
             config = self.config_manager.load_config()
 
@@ -259,31 +420,31 @@ class VisionService(IVisionService):
 
                 logger.info("Step 1/6: Launching graphical region selection")
                 region = self.region_selector.select_region_graphical(monitor=config.monitors.default)
-                logger.info(f"Region selected: {region.width}x{region.height} at ({region.x},{region.y})")
+                logger.info("Region selected: %dx%d at (%d,%d)", region.width, region.height, region.x, region.y)
             else:
                 logger.info("Step 1/6: Using provided region coordinates")
 
             # Step 2: Capture region
-            logger.info(f"Step 2/6: Capturing region: {region.width}x{region.height}")
+            logger.info("Step 2/6: Capturing region: %dx%d", region.width, region.height)
             screenshot = self.capture.capture_region(region)
-            logger.info(f"Region screenshot captured: {screenshot.id}")
+            logger.info("Region screenshot captured: %s", screenshot.id)
 
             # Step 3: Apply privacy zones (if configured)
             if config.privacy.enabled and config.privacy.zones:
-                logger.info(f"Step 3/6: Applying {len(config.privacy.zones)} privacy zone(s)")
+                logger.info("Step 3/6: Applying %d privacy zone(s)", len(config.privacy.zones))
                 screenshot = self.processor.apply_privacy_zones(screenshot, config.privacy.zones)
             else:
                 logger.info("Step 3/6: Privacy zones disabled, skipping")
 
             # Step 4: Optimize image
-            logger.info(f"Step 4/6: Optimizing image (max {config.screenshot.max_size_mb} MB)")
+            logger.info("Step 4/6: Optimizing image (max %s MB)", config.screenshot.max_size_mb)
             screenshot = self.processor.optimize_image(screenshot, config.screenshot.max_size_mb)
 
             # Step 5: Send to AI API (Claude or Gemini)
             api_client = self._get_api_client()
             logger.info("Step 5/6: Sending to AI API")
             response = api_client.send_multimodal_prompt(prompt, screenshot)
-            logger.info(f"Response received: {len(response)} chars")
+            logger.debug("Response received: %d chars", len(response))
 
             # Step 6: Cleanup temp files
             logger.info("Step 6/6: Cleaning up temp files")
@@ -292,10 +453,6 @@ class VisionService(IVisionService):
             logger.info("Vision area command completed successfully")
             return response
 
-        except Exception as e:
-            logger.error(f"Vision area command failed: {e}")
-            raise VisionCommandError(f"Failed to execute vision area command: {e}") from e
-
     def execute_vision_auto_command(self, interval_seconds: Optional[int] = None) -> UUID:
         """
         Execute /vision.auto command: start monitoring session.
@@ -315,12 +472,12 @@ class VisionService(IVisionService):
         Raises:
             VisionCommandError: If session already active or start fails
         """
-        logger.info(f"Executing /vision.auto command: interval={interval_seconds}")
+        logger.info("Executing /vision.auto command: interval=%s", interval_seconds)
 
         if self.session_manager is None:
             raise VisionCommandError("Monitoring session manager not available")
 
-        try:
+        with _vision_error_boundary("Failed to start monitoring session"):
             # Load configuration
             config = self.config_manager.load_config()
 
@@ -333,18 +490,17 @@ class VisionService(IVisionService):
                 raise VisionCommandError("Interval must be positive")
 
             # Start session
-            logger.info(f"Starting monitoring session with {interval_seconds}s interval")
-            session = self.session_manager.start_session(interval_seconds)
-
-            logger.info(f"Monitoring session started: {session.id}")
+            logger.info("Starting monitoring session with %ds interval", interval_seconds)
+            try:
+                session = self.session_manager.start_session(interval_seconds)
+            except SessionAlreadyActiveError as e:
+                raise VisionCommandError(
+                    "A monitoring session is already active. Stop it first with /vision.stop"
+                ) from e
+
+            logger.info("Monitoring session started: %s", session.id)
             return session.id
 
-        except SessionAlreadyActiveError as e:
-            raise VisionCommandError("A monitoring session is already active. Stop it first with /vision.stop") from e
-        except Exception as e:
-            logger.error(f"Failed to start monitoring session: {e}")
-            raise VisionCommandError(f"Failed to start monitoring session: {e}") from e
-
     def execute_vision_stop_command(self) -> None:
         """
         Execute /vision.stop command: stop monitoring session.
@@ -362,7 +518,7 @@ class VisionService(IVisionService):
         if self.session_manager is None:
             raise VisionCommandError("Monitoring session manager not available")
 
-        try:
+        with _vision_error_boundary("Failed to stop monitoring session"):
             # Get active session
             session = self.session_manager.get_active_session()
 
@@ -370,11 +526,7 @@ class VisionService(IVisionService):
                 raise VisionCommandError("No active monitoring session to stop")
 
             # Stop session
-            logger.info(f"Stopping monitoring session: {session.id}")
+            logger.info("Stopping monitoring session: %s", session.id)
             self.session_manager.stop_session(session.id)
 
             logger.info("Monitoring session stopped successfully")
-
-        except Exception as e:
-            logger.error(f"Failed to stop monitoring session: {e}")
-            raise VisionCommandError(f"Failed to stop monitoring session: {e}") from e
@@ -0,0 +1,53 @@
+"""Shared pytest fixtures for the claude-code-vision test suite."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import socket
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+_RAM_DISK = Path("/dev/shm")
+
+
+@pytest.fixture(autouse=True)
+def _no_network(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Fail fast on outbound connections from tests that forgot to mock HTTP.
+
+    Tests marked ``@pytest.mark.integration`` keep real network access.
+    """
+    if request.node.get_closest_marker("integration") is not None:
+        return
+
+    def _deny(*_args, **_kwargs):
+        raise RuntimeError("network disabled in tests; mock the HTTP call or mark the test as integration")
+
+    monkeypatch.setattr(socket.socket, "connect", _deny)
+    monkeypatch.setattr(socket.socket, "connect_ex", _deny)
+
+
+@pytest.fixture(scope="session")
+def ram_session_path(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """
+    Session-wide scratch directory on RAM-backed tmpfs when available.
+
+    Falls back to a directory under pytest's base temp on platforms without a writable ``/dev/shm``.
+    """
+    if not (_RAM_DISK.is_dir() and os.access(_RAM_DISK, os.W_OK)):
+        yield tmp_path_factory.mktemp("ram")
+        return
+
+    path = Path(tempfile.mkdtemp(prefix="cc_vision_", dir=_RAM_DISK))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture()
+def ram_tmp_path(ram_session_path: Path) -> Path:
+    """Per-test scratch directory on the same filesystem as ``ram_session_path``."""
+    return Path(tempfile.mkdtemp(dir=ram_session_path))
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import json
 from datetime import UTC, datetime
 from pathlib import Path
 from types import SimpleNamespace
+from typing import Any, Callable
 from uuid import uuid4
 
 import pytest
+import requests
 from PIL import Image
 
 from src.interfaces.screenshot_service import IClaudeAPIClient
@@ -20,7 +21,7 @@ from src.services.claude_api_client import AnthropicAPIClient
 @pytest.fixture()
 def sample_screenshot(tmp_path: Path) -> Screenshot:
     img_path = tmp_path / "sample.png"
-    Image.new("RGB", (120, 80), color="white").save(img_path)
+    Image.new("1", (120, 80), color=1).save(img_path, compress_level=1)
     size = img_path.stat().st_size
     return Screenshot(
         id=uuid4(),
@@ -36,64 +37,83 @@ def sample_screenshot(tmp_path: Path) -> Screenshot:
     )
 
 
-@pytest.fixture()
-def client_implementation() -> AnthropicAPIClient:
-    return AnthropicAPIClient(api_key="sk-test")
+@pytest.fixture(autouse=True)
+def mock_post(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """
+    Stub Session.post for every test and return a helper that sets its outcome.
 
+    A POST made before the helper is called fails the test instead of reaching the network.
+    """
+    outcome: dict[str, Any] = {}
 
-def test_interface_inheritance(client_implementation: AnthropicAPIClient) -> None:
-    assert isinstance(client_implementation, IClaudeAPIClient)
+    def _post(*_args, **_kwargs):
+        if "error" in outcome:
+            raise outcome["error"]
+        if "response" not in outcome:
+            pytest.fail("Unmocked HTTP POST to the Anthropic API")
+        return outcome["response"]
 
+    monkeypatch.setattr("src.services.claude_api_client.requests.Session.post", _post)
 
-def test_send_multimodal_prompt_returns_string(
-    client_implementation: AnthropicAPIClient,
-    sample_screenshot: Screenshot,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    def _post_ok(*_args, **_kwargs):
-        return SimpleNamespace(status_code=200, text="ok", json=lambda: {"content": [{"text": "ok"}]})
+    def _set_outcome(
+        status: int = 200,
+        body: dict[str, Any] | None = None,
+        text: str = "ok",
+        error: Exception | None = None,
+    ) -> None:
+        if error is not None:
+            outcome["error"] = error
+            return
+        payload = body or {}
+        outcome["response"] = SimpleNamespace(status_code=status, text=text, json=lambda: payload)
 
-    monkeypatch.setattr(
-        "src.services.claude_api_client.requests.post",
-        _post_ok,
-    )
+    return _set_outcome
 
-    response = client_implementation.send_multimodal_prompt("hello", sample_screenshot)
 
-    assert response == "ok"
+@pytest.fixture(scope="module")
+def client_implementation() -> AnthropicAPIClient:
+    # Safe to share: tests stub Session.post on the class and never mutate the client
+    return AnthropicAPIClient(api_key="sk-test")
 
 
-def test_send_multimodal_prompt_with_empty_text(
-    client_implementation: AnthropicAPIClient,
-    sample_screenshot: Screenshot,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    def _post_empty(*_args, **_kwargs):
-        return SimpleNamespace(status_code=200, text="ok", json=lambda: {"content": [{"text": "empty-ok"}]})
+@pytest.fixture()
+def oauth_client_missing(tmp_path: Path) -> AnthropicAPIClient:
+    return AnthropicAPIClient(oauth_token_path=str(tmp_path / "missing.json"))
+
+
+@pytest.fixture()
+def oauth_client_empty(tmp_path: Path) -> AnthropicAPIClient:
+    cfg = tmp_path / "oauth.json"
+    cfg.write_text("{}", encoding="utf-8")
+    return AnthropicAPIClient(oauth_token_path=str(cfg))
 
-    monkeypatch.setattr(
-        "src.services.claude_api_client.requests.post",
-        _post_empty,
-    )
 
-    assert client_implementation.send_multimodal_prompt("", sample_screenshot) == "empty-ok"
+def test_interface_inheritance() -> None:
+    assert issubclass(AnthropicAPIClient, IClaudeAPIClient)
 
 
-def test_send_multimodal_prompt_with_long_text(
+@pytest.mark.parametrize(
+    ("prompt", "reply"),
+    [
+        ("hello", "ok"),
+        ("", "empty-ok"),
+        ("Analyze " * 150, "long-ok"),
+        ("Describe", "done"),
+    ],
+    ids=["short", "empty", "long", "workflow"],
+)
+def test_send_multimodal_prompt_returns_reply_text(
     client_implementation: AnthropicAPIClient,
     sample_screenshot: Screenshot,
-    monkeypatch: pytest.MonkeyPatch,
+    mock_post: Callable[..., None],
+    prompt: str,
+    reply: str,
 ) -> None:
-    def _post_long(*_args, **_kwargs):
-        return SimpleNamespace(status_code=200, text="ok", json=lambda: {"content": [{"text": "long-ok"}]})
+    mock_post(body={"content": [{"text": reply}]})
 
-    monkeypatch.setattr(
-        "src.services.claude_api_client.requests.post",
-        _post_long,
-    )
+    response = client_implementation.send_multimodal_prompt(prompt, sample_screenshot)
 
-    response = client_implementation.send_multimodal_prompt("Analyze " * 150, sample_screenshot)
-    assert isinstance(response, str)
+    assert response == reply
 
 
 def test_send_multimodal_prompt_validates_screenshot_exists(client_implementation: AnthropicAPIClient) -> None:
@@ -118,11 +138,10 @@ def test_validate_oauth_token_returns_bool(client_implementation: AnthropicAPICl
     assert client_implementation.validate_oauth_token() is True
 
 
-def test_validate_oauth_token_missing_config_raises_error(tmp_path: Path) -> None:
-    client = AnthropicAPIClient(oauth_token_path=str(tmp_path / "missing.json"))
-
+@pytest.mark.parametrize("method", ["validate_oauth_token", "refresh_oauth_token"])
+def test_oauth_methods_missing_config_raise_error(oauth_client_missing: AnthropicAPIClient, method: str) -> None:
     with pytest.raises(OAuthConfigNotFoundError):
-        client.validate_oauth_token()
+        getattr(oauth_client_missing, method)()
 
 
 def test_refresh_oauth_token_executes_without_error(client_implementation: AnthropicAPIClient) -> None:
@@ -132,15 +151,9 @@ def test_refresh_oauth_token_executes_without_error(client_implementation: Anthr
 def test_send_multimodal_prompt_invalid_token_raises_auth_error(
     client_implementation: AnthropicAPIClient,
     sample_screenshot: Screenshot,
-    monkeypatch: pytest.MonkeyPatch,
+    mock_post: Callable[..., None],
 ) -> None:
-    def _post_unauthorized(*_args, **_kwargs):
-        return SimpleNamespace(status_code=401, text="bad", json=lambda: {})
-
-    monkeypatch.setattr(
-        "src.services.claude_api_client.requests.post",
-        _post_unauthorized,
-    )
+    mock_post(status=401, text="bad")
 
     with pytest.raises(AuthenticationError):
         client_implementation.send_multimodal_prompt("x", sample_screenshot)
@@ -149,14 +162,9 @@ def test_send_multimodal_prompt_invalid_token_raises_auth_error(
 def test_send_multimodal_prompt_network_error_raises_api_error(
     client_implementation: AnthropicAPIClient,
     sample_screenshot: Screenshot,
-    monkeypatch: pytest.MonkeyPatch,
+    mock_post: Callable[..., None],
 ) -> None:
-    import requests
-
-    def _raise(*_a, **_k):
-        raise requests.exceptions.ConnectionError()
-
-    monkeypatch.setattr("src.services.claude_api_client.requests.post", _raise)
+    mock_post(error=requests.exceptions.ConnectionError())
 
     with pytest.raises(APIError, match="Failed to connect"):
         client_implementation.send_multimodal_prompt("x", sample_screenshot)
@@ -183,35 +191,6 @@ def test_send_multimodal_prompt_too_large_raises_payload_error(
         client_implementation.send_multimodal_prompt("x", oversized)
 
 
-def test_refresh_token_invalid_credentials_raises_auth_error(tmp_path: Path) -> None:
-    cfg = tmp_path / "oauth.json"
-    cfg.write_text(json.dumps({}), encoding="utf-8")
-    client = AnthropicAPIClient(oauth_token_path=str(cfg))
-
+def test_refresh_token_invalid_credentials_raises_auth_error(oauth_client_empty: AnthropicAPIClient) -> None:
     with pytest.raises(AuthenticationError):
-        client.refresh_oauth_token()
-
-
-def test_full_multimodal_workflow(
-    client_implementation: AnthropicAPIClient,
-    sample_screenshot: Screenshot,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    def _post_done(*_args, **_kwargs):
-        return SimpleNamespace(status_code=200, text="ok", json=lambda: {"content": [{"text": "done"}]})
-
-    monkeypatch.setattr(
-        "src.services.claude_api_client.requests.post",
-        _post_done,
-    )
-
-    assert client_implementation.validate_oauth_token() is True
-    response = client_implementation.send_multimodal_prompt("Describe", sample_screenshot)
-    assert response == "done"
-
-
-def test_token_refresh_workflow_with_missing_oauth_config(tmp_path: Path) -> None:
-    client = AnthropicAPIClient(oauth_token_path=str(tmp_path / "missing.json"))
-
-    with pytest.raises(OAuthConfigNotFoundError):
-        client.refresh_oauth_token()
+        oauth_client_empty.refresh_oauth_token()
@@ -1,6 +1,7 @@
 """Executable contract tests for IImageProcessor using PillowImageProcessor."""
 
 from datetime import UTC, datetime
+from pathlib import Path
 from uuid import uuid4
 
 import pytest
@@ -14,23 +15,48 @@ from src.services.temp_file_manager import TempFileManager
 
 
 @pytest.fixture()
-def processor_implementation(tmp_path) -> PillowImageProcessor:
-    temp_manager = TempFileManager(temp_dir=str(tmp_path / "temp"))
-    return PillowImageProcessor(temp_manager=temp_manager)
+def processor_implementation(ram_tmp_path) -> PillowImageProcessor:
+    # Re-encoded images land in RAM-backed tmpfs when the platform offers it
+    return PillowImageProcessor(temp_manager=TempFileManager(temp_dir=str(ram_tmp_path / "temp")))
+
+
+def _patterned_image() -> Image.Image:
+    """Build a white 1200x900 image with a noisy 800x600 block, one channel plane at a time."""
+    xs = range(200, 1000)
+    ys = range(150, 750)
+    # red depends on x only, green on y only, blue on x + y (each row is a shifted slice)
+    red = bytes((x * 17) % 255 for x in xs) * len(ys)
+    green = b"".join(bytes([(y * 13) % 255]) * len(xs) for y in ys)
+    diagonal = bytes((k * 7) % 255 for k in range(xs[0] + ys[0], xs[-1] + ys[-1] + 1))
+    blue = b"".join(diagonal[y - ys[0] : y - ys[0] + len(xs)] for y in ys)
+
+    size = (len(xs), len(ys))
+    pattern = Image.merge("RGB", [Image.frombytes("L", size, plane) for plane in (red, green, blue)])
+    img = Image.new("RGB", (1200, 900), color="white")
+    img.paste(pattern, (xs[0], ys[0]))
+    return img
 
 
-@pytest.fixture()
-def sample_screenshot(tmp_path) -> Screenshot:
-    img = Image.new("RGB", (1200, 900), color="white")
-    pixels = img.load()
-    for x in range(200, 1000):
-        for y in range(150, 750):
-            pixels[x, y] = ((x * 17) % 255, (y * 13) % 255, ((x + y) * 7) % 255)
+@pytest.fixture(scope="session")
+def sample_image_bytes(tmp_path_factory) -> bytes:
+    """Encode the sample JPEG once per session."""
+    img_path = tmp_path_factory.mktemp("sample") / "sample.jpg"
+    _patterned_image().save(img_path, quality=75, optimize=False)
+    return img_path.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def tiny_image_bytes(tmp_path_factory) -> bytes:
+    """Encode a 64x48 solid JPEG once per session for tests that ignore image content."""
+    img_path = tmp_path_factory.mktemp("tiny") / "tiny.jpg"
+    Image.new("RGB", (64, 48), color="white").save(img_path, quality=80)
+    return img_path.read_bytes()
+
 
-    img_path = tmp_path / "sample.jpg"
-    img.save(img_path, quality=95)
+def _write_screenshot(img_path, image_bytes: bytes, resolution: tuple[int, int]) -> Screenshot:
+    img_path.write_bytes(image_bytes)
 
-    size = img_path.stat().st_size
+    size = len(image_bytes)
     return Screenshot(
         id=uuid4(),
         timestamp=datetime.now(tz=UTC),
@@ -38,7 +64,7 @@ def sample_screenshot(tmp_path) -> Screenshot:
         format="jpeg",
         original_size_bytes=size,
         optimized_size_bytes=size,
-        resolution=(1200, 900),
+        resolution=resolution,
         source_monitor=0,
         capture_method="test",
         privacy_zones_applied=False,
@@ -46,42 +72,56 @@ def sample_screenshot(tmp_path) -> Screenshot:
 
 
 @pytest.fixture()
-def invalid_screenshot(tmp_path) -> Screenshot:
-    return Screenshot(
-        id=uuid4(),
-        timestamp=datetime.now(tz=UTC),
-        file_path=tmp_path / "missing.jpg",
-        format="jpeg",
-        original_size_bytes=0,
-        optimized_size_bytes=0,
-        resolution=(0, 0),
-        source_monitor=0,
-        capture_method="test",
-        privacy_zones_applied=False,
-    )
+def sample_screenshot(tmp_path, sample_image_bytes: bytes) -> Screenshot:
+    return _write_screenshot(tmp_path / "sample.jpg", sample_image_bytes, (1200, 900))
+
+
+@pytest.fixture()
+def tiny_screenshot(tmp_path, tiny_image_bytes: bytes) -> Screenshot:
+    return _write_screenshot(tmp_path / "tiny.jpg", tiny_image_bytes, (64, 48))
+
+
+_MISSING_SCREENSHOT = Screenshot(
+    id=uuid4(),
+    timestamp=datetime.now(tz=UTC),
+    file_path=Path("/__cc_vision_nonexistent__/missing.jpg"),
+    format="jpeg",
+    original_size_bytes=0,
+    optimized_size_bytes=0,
+    resolution=(0, 0),
+    source_monitor=0,
+    capture_method="test",
+    privacy_zones_applied=False,
+)
+
+
+@pytest.fixture(scope="session")
+def invalid_screenshot() -> Screenshot:
+    # Every operation fails on the missing file before touching the screenshot, so one instance is shared
+    return _MISSING_SCREENSHOT
 
 
 def test_interface_inheritance(processor_implementation) -> None:
     assert isinstance(processor_implementation, IImageProcessor)
 
 
-def test_optimize_image_returns_screenshot(processor_implementation, sample_screenshot) -> None:
-    optimized = processor_implementation.optimize_image(sample_screenshot, max_size_mb=2.0)
+def test_optimize_image_returns_screenshot(processor_implementation, tiny_screenshot) -> None:
+    optimized = processor_implementation.optimize_image(tiny_screenshot, max_size_mb=2.0)
     assert isinstance(optimized, Screenshot)
     assert optimized.file_path.exists()
 
 
-def test_optimize_image_preserves_metadata(processor_implementation, sample_screenshot) -> None:
-    optimized = processor_implementation.optimize_image(sample_screenshot, max_size_mb=0.2)
-    assert optimized.id == sample_screenshot.id
-    assert optimized.timestamp == sample_screenshot.timestamp
-    assert optimized.format == sample_screenshot.format
-    assert optimized.source_monitor == sample_screenshot.source_monitor
-    assert optimized.capture_method == sample_screenshot.capture_method
+def test_optimize_image_preserves_metadata(processor_implementation, tiny_screenshot) -> None:
+    optimized = processor_implementation.optimize_image(tiny_screenshot, max_size_mb=0.2)
+    assert optimized.id == tiny_screenshot.id
+    assert optimized.timestamp == tiny_screenshot.timestamp
+    assert optimized.format == tiny_screenshot.format
+    assert optimized.source_monitor == tiny_screenshot.source_monitor
+    assert optimized.capture_method == tiny_screenshot.capture_method
 
 
 def test_optimize_image_updates_size_fields(processor_implementation, sample_screenshot) -> None:
-    optimized = processor_implementation.optimize_image(sample_screenshot, max_size_mb=0.2)
+    optimized = processor_implementation.optimize_image(sample_screenshot, max_size_mb=0.1)
     assert optimized.original_size_bytes == sample_screenshot.original_size_bytes
     assert optimized.optimized_size_bytes == optimized.file_path.stat().st_size
     assert optimized.optimized_size_bytes > 0
@@ -89,32 +129,33 @@ def test_optimize_image_updates_size_fields(processor_implementation, sample_scr
 
 def test_optimize_image_maintains_aspect_ratio(processor_implementation, sample_screenshot) -> None:
     original_ratio = sample_screenshot.resolution[0] / sample_screenshot.resolution[1]
-    optimized = processor_implementation.optimize_image(sample_screenshot, max_size_mb=0.2)
+    optimized = processor_implementation.optimize_image(sample_screenshot, max_size_mb=0.1)
     optimized_ratio = optimized.resolution[0] / optimized.resolution[1]
     assert abs(original_ratio - optimized_ratio) / original_ratio < 0.01
 
 
-def test_apply_privacy_zones_returns_screenshot(processor_implementation, sample_screenshot) -> None:
-    zones = [PrivacyZone(name="zone", x=10, y=10, width=100, height=100, monitor=0)]
-    processed = processor_implementation.apply_privacy_zones(sample_screenshot, zones)
+def test_apply_privacy_zones_returns_screenshot(processor_implementation, tiny_screenshot) -> None:
+    # Fits inside the 64x48 tiny image, so this covers normal masking rather than clipping
+    zones = [PrivacyZone(name="zone", x=10, y=10, width=40, height=30, monitor=0)]
+    processed = processor_implementation.apply_privacy_zones(tiny_screenshot, zones)
     assert isinstance(processed, Screenshot)
     assert processed.file_path.exists()
     assert processed.privacy_zones_applied is True
 
 
-def test_apply_privacy_zones_empty_list_marks_applied(processor_implementation, sample_screenshot) -> None:
-    processed = processor_implementation.apply_privacy_zones(sample_screenshot, [])
+def test_apply_privacy_zones_empty_list_marks_applied(processor_implementation, tiny_screenshot) -> None:
+    processed = processor_implementation.apply_privacy_zones(tiny_screenshot, [])
     assert processed.privacy_zones_applied is True
     assert processed.file_path.exists()
 
 
-def test_apply_privacy_zones_preserves_metadata(processor_implementation, sample_screenshot) -> None:
-    zones = [PrivacyZone(name="zone", x=0, y=0, width=50, height=50, monitor=0)]
-    processed = processor_implementation.apply_privacy_zones(sample_screenshot, zones)
-    assert processed.id == sample_screenshot.id
-    assert processed.timestamp == sample_screenshot.timestamp
-    assert processed.format == sample_screenshot.format
-    assert processed.source_monitor == sample_screenshot.source_monitor
+def test_apply_privacy_zones_preserves_metadata(processor_implementation, tiny_screenshot) -> None:
+    zones = [PrivacyZone(name="zone", x=0, y=0, width=40, height=40, monitor=0)]
+    processed = processor_implementation.apply_privacy_zones(tiny_screenshot, zones)
+    assert processed.id == tiny_screenshot.id
+    assert processed.timestamp == tiny_screenshot.timestamp
+    assert processed.format == tiny_screenshot.format
+    assert processed.source_monitor == tiny_screenshot.source_monitor
 
 
 def test_calculate_image_hash_contract(processor_implementation, sample_screenshot) -> None:
@@ -122,6 +163,7 @@ def test_calculate_image_hash_contract(processor_implementation, sample_screensh
     hash2 = processor_implementation.calculate_image_hash(sample_screenshot)
     assert isinstance(hash1, str)
     assert len(hash1) == 64
+    int(hash1, 16)  # raises ValueError unless the digest is hex
     assert hash1 == hash2
 
 
@@ -133,24 +175,18 @@ def test_calculate_image_hash_changes_with_content(processor_implementation, sam
     assert hash_original != hash_modified
 
 
-@pytest.mark.parametrize(
-    "operation",
-    ["optimize", "privacy", "hash"],
-)
+_INVALID_FILE_OPERATIONS = {
+    "optimize": lambda processor, shot: processor.optimize_image(shot, max_size_mb=2.0),
+    "privacy": lambda processor, shot: processor.apply_privacy_zones(
+        shot, [PrivacyZone(name="z", x=0, y=0, width=10, height=10, monitor=0)]
+    ),
+    "hash": lambda processor, shot: processor.calculate_image_hash(shot),
+}
+
+
+@pytest.mark.parametrize("operation", list(_INVALID_FILE_OPERATIONS))
 def test_invalid_file_raises_image_processing_error(
     processor_implementation, invalid_screenshot, operation: str
 ) -> None:
     with pytest.raises(ImageProcessingError):
-        _run_invalid_operation(processor_implementation, invalid_screenshot, operation)
-
-
-def _run_invalid_operation(processor_implementation, invalid_screenshot, operation: str) -> None:
-    if operation == "optimize":
-        processor_implementation.optimize_image(invalid_screenshot, max_size_mb=2.0)
-    elif operation == "privacy":
-        processor_implementation.apply_privacy_zones(
-            invalid_screenshot,
-            [PrivacyZone(name="z", x=0, y=0, width=10, height=10, monitor=0)],
-        )
-    else:
-        processor_implementation.calculate_image_hash(invalid_screenshot)
+        _INVALID_FILE_OPERATIONS[operation](processor_implementation, invalid_screenshot)
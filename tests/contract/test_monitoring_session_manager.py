@@ -1,7 +1,12 @@
 """Executable contract tests for IMonitoringSessionManager implementations."""
 
+import os
+import threading
+import time
+from collections import deque
 from datetime import UTC, datetime
-from uuid import UUID, uuid4
+from typing import Final
+from uuid import UUID
 
 import pytest
 
@@ -10,56 +15,100 @@ from src.lib.exceptions import SessionAlreadyActiveError, SessionNotFoundError
 from src.models.entities import MonitoringSession
 
 
+class _UUIDPool:
+    """Hand out random version-4 UUIDs built from one batched os.urandom read."""
+
+    def __init__(self, size: int = 256, min_size: int = 64):
+        self._size = size
+        self._min_size = min_size
+        self._ids: deque[UUID] = deque()
+        self._refill()
+
+    def _refill(self) -> None:
+        raw = os.urandom(self._size * 16)
+        self._ids.extend(UUID(bytes=raw[i : i + 16], version=4) for i in range(0, len(raw), 16))
+
+    def acquire(self) -> UUID:
+        if len(self._ids) < self._min_size:
+            self._refill()
+        return self._ids.popleft()
+
+
+_uuid_pool = _UUIDPool()
+# Never minted by the pool: version-4 UUIDs always carry non-zero version bits
+_FAKE_ID: Final[UUID] = UUID(int=0)
+_now = datetime.now
+_DEFAULT_INTERVAL = 30
+
+
+def _raise_bad_start(active_session: MonitoringSession | None) -> None:
+    # Cold path for start_session; an active session takes precedence over a bad interval
+    if active_session is not None:
+        raise SessionAlreadyActiveError("session already active")
+    raise ValueError("Interval must be positive")
+
+
 class ContractMonitoringSessionManager(IMonitoringSessionManager):
     """Small deterministic implementation used to enforce interface contract."""
 
     def __init__(self):
         self._active_session: MonitoringSession | None = None
+        self._lock = threading.Lock()
 
     def start_session(self, interval_seconds: int | None = None) -> MonitoringSession:
-        if self._active_session is not None:
-            raise SessionAlreadyActiveError("session already active")
-
-        interval = interval_seconds if interval_seconds is not None else 30
-        if interval <= 0:
-            raise ValueError("Interval must be positive")
-
-        session = MonitoringSession(
-            id=uuid4(),
-            started_at=datetime.now(tz=UTC),
-            interval_seconds=interval,
-            is_active=True,
-            capture_count=0,
-        )
-        self._active_session = session
-        return session
+        interval = _DEFAULT_INTERVAL if interval_seconds is None else interval_seconds
+        with self._lock:
+            if interval <= 0 or self._active_session is not None:
+                _raise_bad_start(self._active_session)
+
+            session = MonitoringSession(
+                id=_uuid_pool.acquire(),
+                started_at=_now(tz=UTC),
+                interval_seconds=interval,
+                is_active=True,
+                capture_count=0,
+            )
+            self._active_session = session
+            return session
 
     def stop_session(self, session_id: UUID) -> None:
-        if self._active_session is None or self._active_session.id != session_id:
-            raise SessionNotFoundError(f"Session {session_id} not found")
-        self._active_session.is_active = False
-        self._active_session = None
+        with self._lock:
+            session = self._require_session(session_id)
+            session.is_active = False
+            self._active_session = None
 
     def pause_session(self, session_id: UUID) -> None:
-        if self._active_session is None or self._active_session.id != session_id:
-            raise SessionNotFoundError(f"Session {session_id} not found")
-        if self._active_session.paused_at is None:
-            self._active_session.paused_at = datetime.now(tz=UTC)
+        with self._lock:
+            session = self._require_session(session_id)
+            if session.paused_at is None:
+                session.paused_at = _now(tz=UTC)
 
     def resume_session(self, session_id: UUID) -> None:
-        if self._active_session is None or self._active_session.id != session_id:
-            raise SessionNotFoundError(f"Session {session_id} not found")
-        self._active_session.paused_at = None
+        with self._lock:
+            self._require_session(session_id).paused_at = None
 
     def get_active_session(self) -> MonitoringSession | None:
         return self._active_session
 
+    def _require_session(self, session_id: UUID) -> MonitoringSession:
+        # Must be called while holding self._lock so the check and the mutation are one step
+        session = self._active_session
+        if session is None or session.id != session_id:
+            raise SessionNotFoundError(f"Session {session_id} not found")
+        return session
+
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def manager_implementation():
     return ContractMonitoringSessionManager()
 
 
+@pytest.fixture(autouse=True)
+def _reset_active_session(manager_implementation) -> None:
+    # The manager is shared across the module; start every test with no active session
+    manager_implementation._active_session = None
+
+
 def test_interface_inheritance(manager_implementation) -> None:
     assert isinstance(manager_implementation, IMonitoringSessionManager)
 
@@ -68,8 +117,8 @@ def test_start_session_returns_monitoring_session(manager_implementation) -> Non
     session = manager_implementation.start_session(interval_seconds=30)
 
     assert isinstance(session, MonitoringSession)
-    assert isinstance(session.id, UUID)
-    assert isinstance(session.started_at, datetime)
+    assert type(session.id) is UUID
+    assert type(session.started_at) is datetime
     assert session.interval_seconds == 30
     assert session.is_active is True
     assert session.capture_count == 0
@@ -99,7 +148,7 @@ def test_stop_session_stops_monitoring(manager_implementation) -> None:
 
 def test_stop_session_nonexistent_raises_error(manager_implementation) -> None:
     with pytest.raises(SessionNotFoundError):
-        manager_implementation.stop_session(uuid4())
+        manager_implementation.stop_session(_FAKE_ID)
 
 
 def test_pause_and_resume_flow(manager_implementation) -> None:
@@ -119,11 +168,10 @@ def test_pause_and_resume_flow(manager_implementation) -> None:
 
 
 def test_pause_resume_nonexistent_raise_error(manager_implementation) -> None:
-    fake_id = uuid4()
     with pytest.raises(SessionNotFoundError):
-        manager_implementation.pause_session(fake_id)
+        manager_implementation.pause_session(_FAKE_ID)
     with pytest.raises(SessionNotFoundError):
-        manager_implementation.resume_session(fake_id)
+        manager_implementation.resume_session(_FAKE_ID)
 
 
 def test_invalid_interval_raises_error(manager_implementation) -> None:
@@ -138,3 +186,35 @@ def test_double_stop_raises_error(manager_implementation) -> None:
     manager_implementation.stop_session(session.id)
     with pytest.raises(SessionNotFoundError):
         manager_implementation.stop_session(session.id)
+
+
+def test_concurrent_start_admits_exactly_one_session(manager_implementation, monkeypatch) -> None:
+    acquire = _uuid_pool.acquire
+
+    def _slow_acquire() -> UUID:
+        # Widen the gap between the active-session check and the assignment
+        time.sleep(0.01)
+        return acquire()
+
+    monkeypatch.setattr(_uuid_pool, "acquire", _slow_acquire)
+    barrier = threading.Barrier(4)
+    started: list[MonitoringSession] = []
+    rejected: list[SessionAlreadyActiveError] = []
+
+    def _start() -> None:
+        barrier.wait()
+        try:
+            started.append(manager_implementation.start_session(interval_seconds=30))
+        except SessionAlreadyActiveError as exc:
+            rejected.append(exc)
+
+    workers = [threading.Thread(target=_start) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(started) == 1
+    assert len(rejected) == 3
+    assert manager_implementation.get_active_session() is started[0]
+    manager_implementation.stop_session(started[0].id)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 
 import pytest
@@ -10,6 +11,20 @@ from src.interfaces.screenshot_service import IRegionSelector
 from src.lib.exceptions import InvalidRegionError, RegionSelectionCancelledError, SelectionToolNotFoundError
 from src.models.entities import CaptureRegion
 
+# Validation is a pure function of the shape; cache the outcome, including the failure message
+_region_error = functools.lru_cache(maxsize=1024)(CaptureRegion.validate_raw)
+
+
+_INVALID_COORDS = (
+    (-10, 0, 100, 100),
+    (0, -10, 100, 100),
+    (0, 0, 0, 100),
+    (0, 0, 100, 0),
+    (0, 0, -1, 10),
+    (0, 0, 10, -1),
+)
+_INVALID_COORD_IDS = ("neg_x", "neg_y", "zero_w", "zero_h", "neg_w", "neg_h")
+
 
 @dataclass
 class _Monitor:
@@ -48,7 +63,13 @@ class FakeRegionSelector(IRegionSelector):
     ) -> CaptureRegion:
         monitor_info = self._ensure_monitor(monitor)
 
-        region = CaptureRegion(
+        error = _region_error(
+            x, y, width, height, monitor_width=monitor_info.width, monitor_height=monitor_info.height
+        )
+        if error is not None:
+            raise InvalidRegionError(error)
+
+        return CaptureRegion(
             x=x,
             y=y,
             width=width,
@@ -57,24 +78,23 @@ class FakeRegionSelector(IRegionSelector):
             selection_method="coordinates",
         )
 
-        try:
-            region.validate(monitor_width=monitor_info.width, monitor_height=monitor_info.height)
-        except ValueError as exc:
-            raise InvalidRegionError(str(exc)) from exc
-
-        return region
-
     def _ensure_monitor(self, monitor: int) -> _Monitor:
         if monitor not in self._monitors:
             raise InvalidRegionError(f"Monitor {monitor} is not available")
         return self._monitors[monitor]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def selector_implementation() -> FakeRegionSelector:
     return FakeRegionSelector()
 
 
+@pytest.fixture(autouse=True)
+def _reset_graphical_mode(selector_implementation: FakeRegionSelector) -> None:
+    # The selector is shared for the whole session; only the graphical mode is mutable
+    selector_implementation.set_graphical_mode("ok")
+
+
 def test_interface_inheritance(selector_implementation: FakeRegionSelector) -> None:
     assert isinstance(selector_implementation, IRegionSelector)
 
@@ -91,20 +111,24 @@ def test_select_region_graphical_returns_capture_region(
     assert region.height > 0
 
 
-def test_select_region_graphical_specific_monitor(selector_implementation: FakeRegionSelector) -> None:
-    region = selector_implementation.select_region_graphical(monitor=1)
-    assert region.monitor == 1
+@pytest.mark.parametrize("monitor", [0, 1])
+def test_select_region_graphical_specific_monitor(selector_implementation: FakeRegionSelector, monitor: int) -> None:
+    region = selector_implementation.select_region_graphical(monitor=monitor)
+    assert region.monitor == monitor
 
 
-def test_select_region_graphical_user_cancels(selector_implementation: FakeRegionSelector) -> None:
-    selector_implementation.set_graphical_mode("cancel")
-    with pytest.raises(RegionSelectionCancelledError):
-        selector_implementation.select_region_graphical()
-
-
-def test_select_region_graphical_tool_not_found(selector_implementation: FakeRegionSelector) -> None:
-    selector_implementation.set_graphical_mode("tool_missing")
-    with pytest.raises(SelectionToolNotFoundError):
+@pytest.mark.parametrize(
+    ("mode", "expected_error"),
+    [("cancel", RegionSelectionCancelledError), ("tool_missing", SelectionToolNotFoundError)],
+    ids=["user_cancels", "tool_not_found"],
+)
+def test_select_region_graphical_mode_errors(
+    selector_implementation: FakeRegionSelector,
+    mode: str,
+    expected_error: type[Exception],
+) -> None:
+    selector_implementation.set_graphical_mode(mode)
+    with pytest.raises(expected_error):
         selector_implementation.select_region_graphical()
 
 
@@ -128,10 +152,7 @@ def test_select_region_coordinates_returns_capture_region(
     assert region.selection_method == "coordinates"
 
 
-@pytest.mark.parametrize(
-    ("x", "y", "width", "height"),
-    [(-10, 0, 100, 100), (0, -10, 100, 100), (0, 0, 0, 100), (0, 0, 100, 0), (0, 0, -1, 10), (0, 0, 10, -1)],
-)
+@pytest.mark.parametrize(("x", "y", "width", "height"), _INVALID_COORDS, ids=_INVALID_COORD_IDS)
 def test_select_region_coordinates_invalid_values_raise_error(
     selector_implementation: FakeRegionSelector,
     x: int,
@@ -177,12 +198,10 @@ def test_select_region_coordinates_out_of_bounds_detected(
         )
 
 
-def test_select_region_coordinates_multiple_monitors(selector_implementation: FakeRegionSelector) -> None:
-    region_primary = selector_implementation.select_region_coordinates(0, 0, 100, 100, monitor=0)
-    region_secondary = selector_implementation.select_region_coordinates(0, 0, 100, 100, monitor=1)
-
-    assert region_primary.monitor == 0
-    assert region_secondary.monitor == 1
+@pytest.mark.parametrize("monitor", [0, 1])
+def test_select_region_coordinates_multiple_monitors(selector_implementation: FakeRegionSelector, monitor: int) -> None:
+    region = selector_implementation.select_region_coordinates(0, 0, 100, 100, monitor=monitor)
+    assert region.monitor == monitor
 
 
 def test_invalid_monitor_index_handled(selector_implementation: FakeRegionSelector) -> None:
@@ -3,29 +3,56 @@
 from __future__ import annotations
 
 import os
+import shutil
 from datetime import UTC, datetime
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
-from PIL import Image
 
 from src.interfaces.screenshot_service import IScreenshotCapture
 from src.lib.exceptions import DisplayNotAvailableError, InvalidRegionError, MonitorNotFoundError
 from src.models.entities import CaptureRegion, Screenshot
 
+# 1x1 RGB PNG; callers only check that the file exists and has a size, never its pixels
+_STUB_PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde"
+    b"\x00\x00\x00\x0cIDATx\x9cc\x10\x91\xd3\x00\x00\x00\xa4\x00[v._\xe3"
+    b"\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+
+
+# Shared by every fake; detect_monitors() hands out copies so callers cannot alter the table
+_MONITORS_DEFAULT = (
+    {"id": 0, "name": "Primary", "width": 1920, "height": 1080, "is_primary": True},
+    {"id": 1, "name": "External", "width": 2560, "height": 1440, "is_primary": False},
+)
+
+# Regions are only read by the fake and the assertions, so one instance per literal is shared
+_REGION_VALID = CaptureRegion(x=100, y=120, width=300, height=220, monitor=0, selection_method="coordinates")
+_REGION_NEGATIVE = CaptureRegion(x=-1, y=0, width=20, height=20, monitor=0, selection_method="coordinates")
+_REGION_OUT_OF_BOUNDS = CaptureRegion(x=1800, y=1000, width=300, height=200, monitor=0, selection_method="coordinates")
+_REGION_UNKNOWN_MONITOR = CaptureRegion(x=1, y=1, width=10, height=10, monitor=99, selection_method="coordinates")
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
 
 class FakeScreenshotCapture(IScreenshotCapture):
     """Minimal deterministic implementation used to enforce interface contract behavior."""
 
-    def __init__(self, out_dir: Path) -> None:
+    def __init__(self, out_dir: Path, *, template: Path, create_file: bool = True, headless: bool = False) -> None:
         self._out_dir = out_dir
         self._out_dir.mkdir(parents=True, exist_ok=True)
+        self._template = template
+        self._create_file = create_file
+        self._headless = headless
         self._counter = 0
-        self._monitors = [
-            {"id": 0, "name": "Primary", "width": 1920, "height": 1080, "is_primary": True},
-            {"id": 1, "name": "External", "width": 2560, "height": 1440, "is_primary": False},
-        ]
+        self._monitors = _MONITORS_DEFAULT
 
     def capture_full_screen(self, monitor: int = 0) -> Screenshot:
         self._ensure_display_available()
@@ -57,7 +84,7 @@ class FakeScreenshotCapture(IScreenshotCapture):
 
     def detect_monitors(self) -> list[dict]:
         self._ensure_display_available()
-        return list(self._monitors)
+        return [dict(m) for m in self._monitors]
 
     def _monitor(self, monitor: int) -> dict:
         if monitor < 0 or monitor >= len(self._monitors):
@@ -65,7 +92,7 @@ class FakeScreenshotCapture(IScreenshotCapture):
         return self._monitors[monitor]
 
     def _ensure_display_available(self) -> None:
-        if os.getenv("FAKE_CAPTURE_HEADLESS") == "1":
+        if self._headless:
             raise DisplayNotAvailableError()
 
     def _create_screenshot(
@@ -78,10 +105,12 @@ class FakeScreenshotCapture(IScreenshotCapture):
     ) -> Screenshot:
         self._counter += 1
         file_path = self._out_dir / f"capture-{self._counter}.png"
-        img = Image.new("RGB", (width, height), color=(20, 30, 40))
-        img.save(file_path, format="PNG")
-
-        size = file_path.stat().st_size
+        if self._create_file:
+            _link_or_copy(self._template, file_path)
+            size = len(_STUB_PNG)
+        else:
+            # Metadata-only tests never open the file; report the raw RGB size instead
+            size = width * height * 3
         return Screenshot(
             id=uuid4(),
             timestamp=datetime.now(tz=UTC),
@@ -97,9 +126,22 @@ class FakeScreenshotCapture(IScreenshotCapture):
         )
 
 
+@pytest.fixture(scope="session")
+def png_template(ram_session_path: Path) -> Path:
+    """Write the stub PNG once; captures hardlink to it from the same filesystem."""
+    template = ram_session_path / "stub.png"
+    template.write_bytes(_STUB_PNG)
+    return template
+
+
+@pytest.fixture()
+def capture_implementation(ram_tmp_path: Path, png_template: Path) -> FakeScreenshotCapture:
+    return FakeScreenshotCapture(out_dir=ram_tmp_path / "captures", template=png_template)
+
+
 @pytest.fixture()
-def capture_implementation(tmp_path: Path) -> FakeScreenshotCapture:
-    return FakeScreenshotCapture(out_dir=tmp_path / "captures")
+def capture_implementation_nofile(ram_tmp_path: Path, png_template: Path) -> FakeScreenshotCapture:
+    return FakeScreenshotCapture(out_dir=ram_tmp_path / "captures", template=png_template, create_file=False)
 
 
 def test_interface_inheritance(capture_implementation: FakeScreenshotCapture) -> None:
@@ -116,8 +158,8 @@ def test_capture_full_screen_returns_screenshot(capture_implementation: FakeScre
     assert screenshot.format == "png"
 
 
-def test_capture_full_screen_default_monitor(capture_implementation: FakeScreenshotCapture) -> None:
-    screenshot = capture_implementation.capture_full_screen()
+def test_capture_full_screen_default_monitor(capture_implementation_nofile: FakeScreenshotCapture) -> None:
+    screenshot = capture_implementation_nofile.capture_full_screen()
     assert screenshot.source_monitor == 0
 
 
@@ -129,30 +171,24 @@ def test_capture_full_screen_invalid_monitor_raises_error(
 
 
 def test_capture_region_returns_screenshot(capture_implementation: FakeScreenshotCapture) -> None:
-    region = CaptureRegion(x=100, y=120, width=300, height=220, monitor=0, selection_method="coordinates")
-
-    screenshot = capture_implementation.capture_region(region)
+    screenshot = capture_implementation.capture_region(_REGION_VALID)
 
     assert isinstance(screenshot, Screenshot)
     assert screenshot.file_path.exists()
-    assert screenshot.capture_region == region
+    assert screenshot.capture_region == _REGION_VALID
     assert screenshot.resolution == (300, 220)
 
 
 def test_capture_region_invalid_coordinates_raises_error(
     capture_implementation: FakeScreenshotCapture,
 ) -> None:
-    region = CaptureRegion(x=-1, y=0, width=20, height=20, monitor=0, selection_method="coordinates")
-
     with pytest.raises(InvalidRegionError):
-        capture_implementation.capture_region(region)
+        capture_implementation.capture_region(_REGION_NEGATIVE)
 
 
 def test_capture_region_out_of_bounds_raises_error(capture_implementation: FakeScreenshotCapture) -> None:
-    region = CaptureRegion(x=1800, y=1000, width=300, height=200, monitor=0, selection_method="coordinates")
-
     with pytest.raises(InvalidRegionError):
-        capture_implementation.capture_region(region)
+        capture_implementation.capture_region(_REGION_OUT_OF_BOUNDS)
 
 
 def test_detect_monitors_returns_list(capture_implementation: FakeScreenshotCapture) -> None:
@@ -181,13 +217,13 @@ def test_multiple_captures_create_different_files(capture_implementation: FakeSc
     assert screenshot2.file_path.exists()
 
 
-def test_capture_method_is_recorded(capture_implementation: FakeScreenshotCapture) -> None:
-    screenshot = capture_implementation.capture_full_screen(monitor=0)
+def test_capture_method_is_recorded(capture_implementation_nofile: FakeScreenshotCapture) -> None:
+    screenshot = capture_implementation_nofile.capture_full_screen(monitor=0)
     assert screenshot.capture_method == "scrot"
 
 
-def test_screenshot_metadata_is_complete(capture_implementation: FakeScreenshotCapture) -> None:
-    screenshot = capture_implementation.capture_full_screen(monitor=0)
+def test_screenshot_metadata_is_complete(capture_implementation_nofile: FakeScreenshotCapture) -> None:
+    screenshot = capture_implementation_nofile.capture_full_screen(monitor=0)
 
     assert screenshot.id is not None
     assert screenshot.timestamp is not None
@@ -198,20 +234,15 @@ def test_screenshot_metadata_is_complete(capture_implementation: FakeScreenshotC
     assert isinstance(screenshot.privacy_zones_applied, bool)
 
 
-def test_capture_raises_display_not_available_when_headless(
-    capture_implementation: FakeScreenshotCapture,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    monkeypatch.setenv("FAKE_CAPTURE_HEADLESS", "1")
+def test_capture_raises_display_not_available_when_headless(ram_tmp_path: Path, png_template: Path) -> None:
+    capture = FakeScreenshotCapture(out_dir=ram_tmp_path / "headless", template=png_template, headless=True)
 
     with pytest.raises(DisplayNotAvailableError):
-        capture_implementation.capture_full_screen(monitor=0)
+        capture.capture_full_screen(monitor=0)
 
 
 def test_capture_region_invalid_monitor_raises_monitor_not_found(
     capture_implementation: FakeScreenshotCapture,
 ) -> None:
-    region = CaptureRegion(x=1, y=1, width=10, height=10, monitor=99, selection_method="coordinates")
-
     with pytest.raises(MonitorNotFoundError):
-        capture_implementation.capture_region(region)
+        capture_implementation.capture_region(_REGION_UNKNOWN_MONITOR)
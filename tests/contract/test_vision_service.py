@@ -2,24 +2,138 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import Mock
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
 from src.interfaces.screenshot_service import IVisionService
-from src.lib.exceptions import SessionAlreadyActiveError, VisionCommandError
+from src.lib.exceptions import APIError, InvalidRegionError, SessionAlreadyActiveError, VisionCommandError
 from src.models.entities import CaptureRegion, Configuration, MonitoringSession, Screenshot
 from src.services.vision_service import VisionService
 
+_SAMPLE_BYTES = b"img"
+_MONITOR_ID = uuid4()
+_RE_INTERVAL_POSITIVE = re.compile("Interval must be positive")
+_RE_ALREADY_ACTIVE = re.compile("already active")
+_RE_NO_ACTIVE_SESSION = re.compile("No active monitoring session")
+_RE_COMMAND_FAILED = re.compile("Failed to execute vision command")
 
-@pytest.fixture()
-def sample_screenshot(tmp_path: Path) -> Screenshot:
-    file_path = tmp_path / "capture.png"
-    file_path.write_bytes(b"img")
-    size = file_path.stat().st_size
+# VisionService only reads the configuration, so every test shares one instance
+_CONFIG = Configuration()
+_CONFIG.privacy.prompt_first_use = False
+_CONFIG.privacy.enabled = False
+_CONFIG.screenshot.max_size_mb = 2.0
+
+
+class _FakeConfigManager:
+    def __init__(self, config: Configuration) -> None:
+        self.config = config
+
+    def load_config(self) -> Configuration:
+        return self.config
+
+
+class _FakeTempManager:
+    def __init__(self) -> None:
+        self.cleaned: list[Path] = []
+
+    def cleanup_temp_file(self, path: Path) -> None:
+        self.cleaned.append(path)
+
+
+class _FakeCapture:
+    def __init__(self, screenshot: Screenshot) -> None:
+        self.screenshot = screenshot
+        self.regions: list[CaptureRegion] = []
+        self.region_error: Exception | None = None
+
+    def capture_full_screen(self, monitor: int = 0) -> Screenshot:  # noqa: ARG002
+        return self.screenshot
+
+    def capture_region(self, region: CaptureRegion) -> Screenshot:
+        self.regions.append(region)
+        if self.region_error is not None:
+            raise self.region_error
+        return self.screenshot
+
+
+class _FakeProcessor:
+    def apply_privacy_zones(self, screenshot: Screenshot, zones: list) -> Screenshot:  # noqa: ARG002
+        return screenshot
+
+    def optimize_image(self, screenshot: Screenshot, max_size_mb: float = 2.0) -> Screenshot:  # noqa: ARG002
+        return screenshot
+
+
+class _FakeAPIClient:
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+        self.error: Exception | None = None
+
+    def warm_connection(self) -> None:
+        pass
+
+    def send_multimodal_prompt(self, text: str, screenshot: Screenshot) -> str:  # noqa: ARG002
+        self.prompts.append(text)
+        if self.error is not None:
+            raise self.error
+        return "analysis"
+
+
+class _FakeRegionSelector:
+    def __init__(self) -> None:
+        self.graphical_calls = 0
+
+    def select_region_graphical(self, monitor: int = 0) -> CaptureRegion:
+        self.graphical_calls += 1
+        return CaptureRegion(x=10, y=20, width=300, height=200, monitor=monitor, selection_method="graphical")
+
+
+class _FakeSessionManager:
+    def __init__(self) -> None:
+        self.started_intervals: list[int | None] = []
+        self.stopped: list[UUID] = []
+        self.start_error: Exception | None = None
+        self.active: MonitoringSession | None = MonitoringSession(
+            id=uuid4(),
+            started_at=datetime.now(tz=UTC),
+            interval_seconds=30,
+        )
+
+    def start_session(self, interval_seconds: int | None = None) -> MonitoringSession:
+        self.started_intervals.append(interval_seconds)
+        if self.start_error is not None:
+            raise self.start_error
+        return MonitoringSession(id=_MONITOR_ID, started_at=datetime.now(tz=UTC), interval_seconds=interval_seconds or 30)
+
+    def get_active_session(self) -> MonitoringSession | None:
+        return self.active
+
+    def stop_session(self, session_id: UUID) -> None:
+        self.stopped.append(session_id)
+
+
+@dataclass
+class _Doubles:
+    config_manager: _FakeConfigManager
+    temp_manager: _FakeTempManager
+    capture: _FakeCapture
+    processor: _FakeProcessor
+    api_client: _FakeAPIClient
+    region_selector: _FakeRegionSelector
+    session_manager: _FakeSessionManager
+
+
+@pytest.fixture(scope="session")
+def sample_screenshot(tmp_path_factory: pytest.TempPathFactory) -> Screenshot:
+    file_path = tmp_path_factory.mktemp("vision") / "capture.png"
+    file_path.write_bytes(_SAMPLE_BYTES)
+    size = len(_SAMPLE_BYTES)
     return Screenshot(
         id=uuid4(),
         timestamp=datetime.now(tz=UTC),
@@ -35,69 +149,20 @@ def sample_screenshot(tmp_path: Path) -> Screenshot:
 
 
 @pytest.fixture()
-def configured_service(sample_screenshot: Screenshot) -> tuple[VisionService, dict[str, Mock]]:
-    config = Configuration()
-    config.privacy.prompt_first_use = False
-    config.privacy.enabled = False
-    config.screenshot.max_size_mb = 2.0
-
-    config_manager = Mock()
-    config_manager.load_config.return_value = config
-
-    temp_manager = Mock()
-    capture = Mock()
-    capture.capture_full_screen.return_value = sample_screenshot
-    capture.capture_region.return_value = sample_screenshot
-
-    processor = Mock()
-    processor.apply_privacy_zones.return_value = sample_screenshot
-    processor.optimize_image.return_value = sample_screenshot
-
-    api_client = Mock()
-    api_client.send_multimodal_prompt.return_value = "analysis"
-
-    region_selector = Mock()
-    region_selector.select_region_graphical.return_value = CaptureRegion(
-        x=10,
-        y=20,
-        width=300,
-        height=200,
-        monitor=0,
-        selection_method="graphical",
+def configured_service(sample_screenshot: Screenshot) -> Iterator[tuple[VisionService, _Doubles]]:
+    # Plain recording fakes instead of Mock: the service makes several calls per command
+    doubles = _Doubles(
+        config_manager=_FakeConfigManager(_CONFIG),
+        temp_manager=_FakeTempManager(),
+        capture=_FakeCapture(sample_screenshot),
+        processor=_FakeProcessor(),
+        api_client=_FakeAPIClient(),
+        region_selector=_FakeRegionSelector(),
+        session_manager=_FakeSessionManager(),
     )
-
-    session_manager = Mock()
-    session_manager.start_session.return_value = MonitoringSession(
-        id=uuid4(),
-        started_at=datetime.now(tz=UTC),
-        interval_seconds=30,
-    )
-    session_manager.get_active_session.return_value = MonitoringSession(
-        id=uuid4(),
-        started_at=datetime.now(tz=UTC),
-        interval_seconds=30,
-    )
-
-    service = VisionService(
-        config_manager=config_manager,
-        temp_manager=temp_manager,
-        capture=capture,
-        processor=processor,
-        api_client=api_client,
-        region_selector=region_selector,
-        session_manager=session_manager,
-    )
-
-    mocks = {
-        "config_manager": config_manager,
-        "temp_manager": temp_manager,
-        "capture": capture,
-        "processor": processor,
-        "api_client": api_client,
-        "region_selector": region_selector,
-        "session_manager": session_manager,
-    }
-    return service, mocks
+    service = VisionService(**vars(doubles))
+    yield service, doubles
+    service.close()
 
 
 def test_interface_inheritance(configured_service) -> None:
@@ -105,103 +170,102 @@ def test_interface_inheritance(configured_service) -> None:
     assert isinstance(service, IVisionService)
 
 
-def test_execute_vision_command_returns_string(configured_service) -> None:
-    service, _ = configured_service
-    result = service.execute_vision_command("What do you see?")
+@pytest.mark.parametrize(
+    "prompt",
+    ["What do you see?", "", "Analyze " * 200, "Test vision command"],
+    ids=["short", "empty", "long", "workflow"],
+)
+def test_execute_vision_command_returns_string(configured_service, prompt: str) -> None:
+    service, doubles = configured_service
+    result = service.execute_vision_command(prompt)
     assert isinstance(result, str)
     assert result == "analysis"
+    assert doubles.api_client.prompts == [prompt]
 
 
-def test_execute_vision_command_with_empty_prompt(configured_service) -> None:
-    service, mocks = configured_service
-    result = service.execute_vision_command("")
-    assert result == "analysis"
-    mocks["api_client"].send_multimodal_prompt.assert_called_once()
-
-
-def test_execute_vision_command_with_long_prompt(configured_service) -> None:
-    service, _ = configured_service
-    result = service.execute_vision_command("Analyze " * 200)
-    assert isinstance(result, str)
-
-
-def test_execute_vision_command_calls_cleanup(configured_service) -> None:
-    service, mocks = configured_service
+def test_execute_vision_command_calls_cleanup(configured_service, sample_screenshot: Screenshot) -> None:
+    service, doubles = configured_service
     service.execute_vision_command("cleanup")
-    mocks["temp_manager"].cleanup_temp_file.assert_called_once()
-
-
-def test_execute_vision_area_command_returns_string_with_coordinates(configured_service) -> None:
-    service, mocks = configured_service
-    region = CaptureRegion(x=0, y=0, width=100, height=100, monitor=0, selection_method="coordinates")
+    assert doubles.temp_manager.cleaned == [sample_screenshot.file_path]
 
-    result = service.execute_vision_area_command("Area", region=region)
 
-    assert result == "analysis"
-    mocks["capture"].capture_region.assert_called_once_with(region)
+_COORDINATE_REGION = CaptureRegion(x=0, y=0, width=100, height=100, monitor=0, selection_method="coordinates")
+_NEGATIVE_REGION = CaptureRegion(x=-1, y=0, width=10, height=10, monitor=0, selection_method="coordinates")
 
 
-def test_execute_vision_area_command_without_region_uses_selector(configured_service) -> None:
-    service, mocks = configured_service
+@pytest.mark.parametrize(
+    ("region", "selector_calls"),
+    [(_COORDINATE_REGION, 0), (None, 1)],
+    ids=["coordinates", "graphical"],
+)
+def test_execute_vision_area_command_returns_string(
+    configured_service,
+    region: CaptureRegion | None,
+    selector_calls: int,
+) -> None:
+    service, doubles = configured_service
 
-    result = service.execute_vision_area_command("Area")
+    result = service.execute_vision_area_command("Area", region=region)
 
     assert result == "analysis"
-    mocks["region_selector"].select_region_graphical.assert_called_once()
+    assert doubles.region_selector.graphical_calls == selector_calls
+    assert len(doubles.capture.regions) == 1
+    if region is not None:
+        assert doubles.capture.regions == [region]
 
 
 def test_execute_vision_area_command_invalid_region_raises_vision_error(configured_service) -> None:
-    service, mocks = configured_service
-    bad_region = CaptureRegion(x=-1, y=0, width=10, height=10, monitor=0, selection_method="coordinates")
-    mocks["capture"].capture_region.side_effect = ValueError("invalid")
+    service, doubles = configured_service
+    doubles.capture.region_error = InvalidRegionError("invalid")
 
     with pytest.raises(VisionCommandError):
-        service.execute_vision_area_command("x", bad_region)
+        service.execute_vision_area_command("x", _NEGATIVE_REGION)
 
 
 def test_execute_vision_auto_command_returns_session_id(configured_service) -> None:
     service, _ = configured_service
     session_id = service.execute_vision_auto_command(interval_seconds=30)
-    assert session_id is not None
+    assert session_id is _MONITOR_ID
 
 
 def test_execute_vision_auto_command_uses_default_interval(configured_service) -> None:
-    service, mocks = configured_service
+    service, doubles = configured_service
     service.execute_vision_auto_command(interval_seconds=None)
-    mocks["session_manager"].start_session.assert_called_once_with(30)
+    assert doubles.session_manager.started_intervals == [30]
 
 
 def test_execute_vision_auto_command_invalid_interval_raises_error(configured_service) -> None:
     service, _ = configured_service
-    with pytest.raises(VisionCommandError, match="Interval must be positive"):
+    with pytest.raises(VisionCommandError, match=_RE_INTERVAL_POSITIVE):
         service.execute_vision_auto_command(interval_seconds=0)
 
 
 def test_execute_vision_auto_command_prevents_multiple_sessions(configured_service) -> None:
-    service, mocks = configured_service
-    mocks["session_manager"].start_session.side_effect = SessionAlreadyActiveError("abc")
+    service, doubles = configured_service
+    doubles.session_manager.start_error = SessionAlreadyActiveError("abc")
 
-    with pytest.raises(VisionCommandError, match="already active"):
+    with pytest.raises(VisionCommandError, match=_RE_ALREADY_ACTIVE):
         service.execute_vision_auto_command(interval_seconds=30)
 
 
 def test_execute_vision_stop_command_stops_active_session(configured_service) -> None:
-    service, mocks = configured_service
+    service, doubles = configured_service
+    active = doubles.session_manager.active
     service.execute_vision_stop_command()
-    mocks["session_manager"].stop_session.assert_called_once()
+    assert doubles.session_manager.stopped == [active.id]
 
 
 def test_execute_vision_stop_command_without_active_session_raises_error(configured_service) -> None:
-    service, mocks = configured_service
-    mocks["session_manager"].get_active_session.return_value = None
+    service, doubles = configured_service
+    doubles.session_manager.active = None
 
-    with pytest.raises(VisionCommandError, match="No active monitoring session"):
+    with pytest.raises(VisionCommandError, match=_RE_NO_ACTIVE_SESSION):
         service.execute_vision_stop_command()
 
 
 def test_execute_vision_command_api_error_is_wrapped(configured_service) -> None:
-    service, mocks = configured_service
-    mocks["api_client"].send_multimodal_prompt.side_effect = RuntimeError("api down")
+    service, doubles = configured_service
+    doubles.api_client.error = APIError("api down")
 
-    with pytest.raises(VisionCommandError, match="Failed to execute vision command"):
+    with pytest.raises(VisionCommandError, match=_RE_COMMAND_FAILED):
         service.execute_vision_command("hello")
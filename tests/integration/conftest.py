@@ -0,0 +1,16 @@
+"""Shared fixtures for the CLI integration tests."""
+
+from __future__ import annotations
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="module")
+def cli_runner() -> CliRunner:
+    """
+    One Click test runner per module.
+
+    ``CliRunner.invoke`` isolates streams and environment per call, so tests can share it safely.
+    """
+    return CliRunner()
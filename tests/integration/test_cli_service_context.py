@@ -0,0 +1,24 @@
+"""Integration tests shared by the CLI commands that read VisionService from the Click context."""
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from src.cli.vision_area_command import vision_area
+from src.cli.vision_auto_command import vision_auto
+from src.cli.vision_stop_command import vision_stop
+
+
+@pytest.mark.parametrize(
+    ("command", "args"),
+    [(vision_area, ["Prompt"]), (vision_auto, ["--interval", "5"]), (vision_stop, [])],
+    ids=["area", "auto", "stop"],
+)
+def test_command_requires_service_when_context_missing(
+    cli_runner: CliRunner, command: click.Command, args: list
+) -> None:
+    """Each command should fail with an actionable message when no service is in the context."""
+    result = cli_runner.invoke(command, args)
+
+    assert result.exit_code != 0
+    assert "Vision service not initialized" in result.output
@@ -1,5 +1,6 @@
 """Integration tests for first-use privacy confirmation workflow (FR-013)."""
 
+import io
 from datetime import UTC, datetime
 from pathlib import Path
 from uuid import uuid4
@@ -9,138 +10,170 @@ import yaml
 
 from src.lib.exceptions import VisionCommandError
 from src.models.entities import Configuration, PrivacyConfig, Screenshot
+from src.services import vision_service as vision_service_module
 from src.services.config_manager import ConfigurationManager
 from src.services.vision_service import VisionService
 
-
-def _build_service(mocker, config: Configuration):
-    config.ai_provider.provider = "claude"
-    config.ai_provider.fallback_to_gemini = False
-
-    config_manager = mocker.Mock()
-    config_manager.load_config.return_value = config
-
-    temp_manager = mocker.Mock()
-    capture = mocker.Mock()
-    processor = mocker.Mock()
-    api_client = mocker.Mock()
-
-    screenshot = Screenshot(
-        id=uuid4(),
-        timestamp=datetime.now(tz=UTC),
-        file_path=Path("/tmp/test.png"),
-        format="png",
-        original_size_bytes=1024,
-        optimized_size_bytes=512,
-        resolution=(100, 100),
-        source_monitor=0,
-        capture_method="scrot",
-        privacy_zones_applied=False,
-    )
-
-    capture.capture_full_screen.return_value = screenshot
-    processor.optimize_image.return_value = screenshot
-    processor.apply_privacy_zones.return_value = screenshot
-    api_client.send_multimodal_prompt.return_value = "analysis"
-
-    service = VisionService(
-        config_manager=config_manager,
-        temp_manager=temp_manager,
-        capture=capture,
-        processor=processor,
-        api_client=api_client,
-        region_selector=mocker.Mock(),
-        session_manager=mocker.Mock(),
-        gemini_client=None,
-    )
-
-    return service, config_manager, api_client, temp_manager
+# Shared by every service; VisionService never mutates the screenshot it gets back from the mocks
+_SCREENSHOT = Screenshot(
+    id=uuid4(),
+    timestamp=datetime.now(tz=UTC),
+    file_path=Path("/tmp/test.png"),
+    format="png",
+    original_size_bytes=1024,
+    optimized_size_bytes=512,
+    resolution=(100, 100),
+    source_monitor=0,
+    capture_method="scrot",
+    privacy_zones_applied=False,
+)
+
+# Pre-encoded config.yaml bodies for each prompt state, so the load test does no yaml.dump
+_PROMPT_STATE_YAML = {
+    prompt_first_use: yaml.dump(
+        {"version": "1.0", "privacy": {"enabled": True, "prompt_first_use": prompt_first_use, "zones": []}},
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+    ).encode("utf-8")
+    for prompt_first_use in (True, False)
+}
+
+
+@pytest.fixture(scope="module")
+def config_dir(tmp_path_factory):
+    # Every test writes config.yaml before reading it, so one directory serves the module
+    return tmp_path_factory.mktemp("first_use_cfg")
+
+
+@pytest.fixture(scope="module")
+def shared_config_manager(config_dir):
+    return ConfigurationManager(config_dir / "config.yaml")
 
 
 class TestFirstUseConfiguration:
     @pytest.fixture()
-    def config_manager(self, tmp_path):
-        config_file = tmp_path / "config.yaml"
-        return ConfigurationManager(config_file)
+    def config_manager(self, shared_config_manager):
+        # Every test writes the file itself; start each one without a parse cached by the previous test
+        shared_config_manager.clear_cache()
+        return shared_config_manager
 
     def test_default_config_has_prompt_enabled(self):
         config = Configuration()
         assert config.privacy.prompt_first_use is True
 
-    def test_config_persists_prompt_state(self, config_manager):
+    @pytest.mark.parametrize("prompt_first_use", [True, False])
+    def test_config_persists_prompt_state(self, config_manager, prompt_first_use):
         config = Configuration(
             privacy=PrivacyConfig(
                 enabled=True,
-                prompt_first_use=False,
+                prompt_first_use=prompt_first_use,
                 zones=[],
             )
         )
         config_manager.save_config(config)
 
         with config_manager.config_path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-
-        assert data["privacy"]["prompt_first_use"] is False
-
-    def test_config_loads_prompt_state(self, config_manager):
-        config_data = {
-            "version": "1.0",
-            "privacy": {
-                "enabled": True,
-                "prompt_first_use": False,
-                "zones": [],
-            },
-        }
-        with config_manager.config_path.open("w", encoding="utf-8") as f:
-            yaml.dump(config_data, f)
+            data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+        assert data["privacy"]["prompt_first_use"] is prompt_first_use
+
+    @pytest.mark.parametrize("prompt_first_use", [True, False])
+    def test_config_loads_prompt_state(self, config_manager, prompt_first_use):
+        config_manager.config_path.write_bytes(_PROMPT_STATE_YAML[prompt_first_use])
 
         loaded = config_manager.load_config()
-        assert loaded.privacy.prompt_first_use is False
+        assert loaded.privacy.prompt_first_use is prompt_first_use
 
 
 class TestFirstUseWorkflow:
-    def test_prompt_acceptance_disables_future_prompt(self, mocker):
+    @pytest.fixture()
+    def sentinel_path(self, tmp_path):
+        return tmp_path / ".privacy_accepted"
+
+    @pytest.fixture()
+    def config(self):
+        # Fresh per test: the dataclass defaults build faster than a deepcopy of a shared template
         config = Configuration()
         config.privacy.prompt_first_use = True
-        service, config_manager, _api_client, _temp_manager = _build_service(mocker, config)
+        config.ai_provider.provider = "claude"
+        config.ai_provider.fallback_to_gemini = False
+        return config
+
+    @pytest.fixture()
+    def service_bundle(self, mocker, config, sentinel_path):
+        # The service reads config lazily, so tests may still adjust it after this fixture runs
+        config_manager = mocker.Mock()
+        config_manager.load_config.return_value = config
+
+        temp_manager = mocker.Mock()
+        capture = mocker.Mock()
+        processor = mocker.Mock()
+        api_client = mocker.Mock()
+
+        capture.capture_full_screen.return_value = _SCREENSHOT
+        processor.optimize_image.return_value = _SCREENSHOT
+        processor.apply_privacy_zones.return_value = _SCREENSHOT
+        api_client.send_multimodal_prompt.return_value = "analysis"
+
+        service = VisionService(
+            config_manager=config_manager,
+            temp_manager=temp_manager,
+            capture=capture,
+            processor=processor,
+            api_client=api_client,
+            region_selector=mocker.Mock(),
+            session_manager=mocker.Mock(),
+            gemini_client=None,
+            privacy_sentinel_path=sentinel_path,
+        )
+        yield service, config_manager, api_client, temp_manager
+        service.close()
 
-        confirm = mocker.patch("click.confirm", return_value=True)
+    def test_prompt_acceptance_disables_future_prompt(self, mocker, service_bundle):
+        service, config_manager, _api_client, _temp_manager = service_bundle
+
+        confirm = mocker.patch.object(vision_service_module, "_confirm", return_value=True)
 
         assert service._check_first_use_prompt() is True
-        assert config.privacy.prompt_first_use is False
-        config_manager.save_config.assert_called_once_with(config)
+        assert service.privacy_sentinel_path.exists()
+        config_manager.save_config.assert_not_called()
         confirm.assert_called_once()
 
-    def test_prompt_rejection_raises_actionable_error(self, mocker):
-        config = Configuration()
-        config.privacy.prompt_first_use = True
-        service, config_manager, _api_client, _temp_manager = _build_service(mocker, config)
+    def test_prompt_rejection_raises_actionable_error(self, mocker, service_bundle):
+        service, config_manager, _api_client, _temp_manager = service_bundle
 
-        mocker.patch("click.confirm", return_value=False)
+        mocker.patch.object(vision_service_module, "_confirm", return_value=False)
 
         with pytest.raises(VisionCommandError, match="Privacy terms not accepted"):
             service._check_first_use_prompt()
 
+        assert not service.privacy_sentinel_path.exists()
         config_manager.save_config.assert_not_called()
 
-    def test_prompt_not_shown_when_disabled(self, mocker):
-        config = Configuration()
+    def test_prompt_not_shown_when_disabled(self, mocker, config, service_bundle):
         config.privacy.prompt_first_use = False
-        service, config_manager, _api_client, _temp_manager = _build_service(mocker, config)
+        service, config_manager, _api_client, _temp_manager = service_bundle
 
-        confirm = mocker.patch("click.confirm")
+        confirm = mocker.patch.object(vision_service_module, "_confirm")
 
         assert service._check_first_use_prompt() is True
         confirm.assert_not_called()
         config_manager.save_config.assert_not_called()
 
-    def test_execute_vision_command_shows_prompt_only_once(self, mocker):
-        config = Configuration()
-        config.privacy.prompt_first_use = True
+    def test_prompt_skipped_when_sentinel_exists(self, mocker, sentinel_path, service_bundle):
+        sentinel_path.touch()
+        service, config_manager, _api_client, _temp_manager = service_bundle
+
+        confirm = mocker.patch.object(vision_service_module, "_confirm")
+
+        assert service._check_first_use_prompt() is True
+        confirm.assert_not_called()
+        config_manager.save_config.assert_not_called()
+
+    def test_execute_vision_command_shows_prompt_only_once(self, mocker, config, service_bundle):
         config.privacy.enabled = False
-        service, _config_manager, api_client, temp_manager = _build_service(mocker, config)
+        service, _config_manager, api_client, temp_manager = service_bundle
 
-        confirm = mocker.patch("click.confirm", return_value=True)
+        confirm = mocker.patch.object(vision_service_module, "_confirm", return_value=True)
 
         first = service.execute_vision_command("First call")
         second = service.execute_vision_command("Second call")
@@ -151,17 +184,57 @@ class TestFirstUseWorkflow:
         assert api_client.send_multimodal_prompt.call_count == 2
         assert temp_manager.cleanup_temp_file.call_count == 2
 
-    def test_prompt_prints_privacy_notice_header(self, mocker):
-        config = Configuration()
-        config.privacy.prompt_first_use = True
-        service, _config_manager, _api_client, _temp_manager = _build_service(mocker, config)
+    def test_prompt_prints_privacy_notice_header(self, mocker, service_bundle):
+        service, _config_manager, _api_client, _temp_manager = service_bundle
 
-        mocker.patch("click.confirm", return_value=True)
-        print_mock = mocker.patch("builtins.print")
+        mocker.patch.object(vision_service_module, "_confirm", return_value=True)
+        out = io.StringIO()
 
-        service._check_first_use_prompt()
+        service._check_first_use_prompt(out=out)
 
-        printed = " ".join(" ".join(map(str, c.args)) for c in print_mock.call_args_list)
+        printed = out.getvalue()
         assert "PRIVACY NOTICE" in printed
         assert "Capture screenshots of your screen" in printed
         assert "Immediately delete screenshots after transmission" in printed
+
+
+class TestPrivacySentinel:
+    @pytest.fixture()
+    def config_manager(self, tmp_path):
+        config_manager = ConfigurationManager(tmp_path / "custom" / "config.yaml")
+        config = Configuration()
+        config.privacy.enabled = False
+        config_manager.save_config(config)
+        return config_manager
+
+    @pytest.fixture()
+    def service(self, mocker, config_manager):
+        service = VisionService(
+            config_manager=config_manager,
+            temp_manager=mocker.Mock(),
+            capture=mocker.Mock(),
+            processor=mocker.Mock(),
+            api_client=mocker.Mock(),
+        )
+        yield service
+        service.close()
+
+    def test_sentinel_lives_next_to_custom_config(self, service, config_manager):
+        assert service.privacy_sentinel_path == config_manager.config_path.parent / ".privacy_accepted"
+
+    def test_acceptance_survives_later_config_saves(self, mocker, service, config_manager):
+        confirm = mocker.patch.object(vision_service_module, "_confirm", return_value=True)
+        service._check_first_use_prompt(out=io.StringIO())
+
+        # e.g. add-privacy-zone or init rewriting config.yaml after acceptance
+        config_manager.save_config(config_manager.load_config())
+        fresh = VisionService(
+            config_manager=config_manager,
+            temp_manager=mocker.Mock(),
+            capture=mocker.Mock(),
+            processor=mocker.Mock(),
+            api_client=mocker.Mock(),
+        )
+        fresh._check_first_use_prompt(out=io.StringIO())
+
+        assert confirm.call_count == 1
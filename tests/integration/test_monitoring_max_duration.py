@@ -1,7 +1,9 @@
 """Integration tests for max-duration behavior in MonitoringSessionManager."""
 
-from datetime import UTC, datetime, timedelta
-from uuid import uuid4
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import UTC, datetime
+from uuid import UUID
 
 import pytest
 
@@ -9,7 +11,7 @@ from src.models.entities import Configuration, MonitoringSession
 from src.services.monitoring_session_manager import MonitoringSessionManager
 
 
-def _build_manager(mocker, max_duration_minutes: int):
+def _build_manager(mocker, max_duration_minutes: int, **time_hooks):
     config = Configuration()
     config.monitoring.max_duration_minutes = max_duration_minutes
     config.monitoring.idle_pause_minutes = 0
@@ -26,29 +28,46 @@ def _build_manager(mocker, max_duration_minutes: int):
         processor=mocker.Mock(),
         api_client=mocker.Mock(),
         idle_seconds_provider=lambda: 0.0,
+        **time_hooks,
     )
 
 
+def _stepping_clock(*minutes: float) -> Callable[[], float]:
+    """Monotonic clock stepping through the given minutes, then holding the last one."""
+    readings = [m * 60.0 for m in minutes]
+    position = [0]
+
+    def _clock() -> float:
+        index = position[0]
+        position[0] = min(index + 1, len(readings) - 1)
+        return readings[index]
+
+    return _clock
+
+
+def _no_sleep(_seconds: float) -> None:
+    pass
+
+
+_PROTO_SESSION = MonitoringSession(
+    id=UUID(int=0),
+    started_at=datetime(2026, 1, 1, tzinfo=UTC),
+    interval_seconds=1,
+    is_active=True,
+)
+
+
 def _active_session() -> MonitoringSession:
-    return MonitoringSession(
-        id=uuid4(),
-        started_at=datetime.now(tz=UTC),
-        interval_seconds=1,
-        is_active=True,
-    )
+    # Tests mutate the session, so hand out a copy with its own screenshots list
+    return replace(_PROTO_SESSION, screenshots=[])
 
 
 class TestMaxDurationAutoStop:
     def test_session_stops_after_max_duration(self, mocker) -> None:
-        manager = _build_manager(mocker, max_duration_minutes=5)
+        manager = _build_manager(mocker, max_duration_minutes=5, clock=_stepping_clock(0, 6))
         manager._active_session = _active_session()
         perform_capture = mocker.patch.object(manager, "_perform_capture")
 
-        t0 = datetime(2026, 1, 1, tzinfo=UTC)
-        t1 = t0 + timedelta(minutes=6)
-        mock_dt = mocker.patch("src.services.monitoring_session_manager.datetime")
-        mock_dt.now.side_effect = [t0, t1]
-
         manager._capture_loop()
 
         assert manager._active_session.is_active is False
@@ -56,7 +75,7 @@ class TestMaxDurationAutoStop:
         perform_capture.assert_not_called()
 
     def test_max_duration_can_be_disabled(self, mocker) -> None:
-        manager = _build_manager(mocker, max_duration_minutes=0)
+        manager = _build_manager(mocker, max_duration_minutes=0, sleep_fn=_no_sleep)
         manager._active_session = _active_session()
 
         perform_called = {"count": 0}
@@ -66,7 +85,6 @@ class TestMaxDurationAutoStop:
             manager._stop_event.set()
 
         manager._perform_capture = _perform_capture
-        mocker.patch("src.services.monitoring_session_manager.time.sleep", side_effect=lambda _s: None)
 
         manager._capture_loop()
 
@@ -95,14 +113,9 @@ class TestMaxDurationCalculation:
             manager.stop_session(session.id)
 
     def test_session_marked_inactive_after_auto_stop(self, mocker) -> None:
-        manager = _build_manager(mocker, max_duration_minutes=1)
+        manager = _build_manager(mocker, max_duration_minutes=1, clock=_stepping_clock(0, 2))
         manager._active_session = _active_session()
 
-        t0 = datetime(2026, 1, 1, tzinfo=UTC)
-        t1 = t0 + timedelta(minutes=2)
-        mock_dt = mocker.patch("src.services.monitoring_session_manager.datetime")
-        mock_dt.now.side_effect = [t0, t1]
-
         manager._capture_loop()
 
         assert manager._active_session.is_active is False
@@ -118,15 +131,10 @@ class TestMaxDurationCalculation:
 
 class TestMaxDurationWithPause:
     def test_paused_time_counted_toward_max_duration(self, mocker) -> None:
-        manager = _build_manager(mocker, max_duration_minutes=10)
+        manager = _build_manager(mocker, max_duration_minutes=10, clock=_stepping_clock(0, 11))
         manager._active_session = _active_session()
         manager._active_session.paused_at = datetime.now(tz=UTC)
 
-        t0 = datetime(2026, 1, 1, tzinfo=UTC)
-        t1 = t0 + timedelta(minutes=11)
-        mock_dt = mocker.patch("src.services.monitoring_session_manager.datetime")
-        mock_dt.now.side_effect = [t0, t1]
-
         manager._capture_loop()
 
         assert manager._active_session.is_active is False
@@ -135,14 +143,13 @@ class TestMaxDurationWithPause:
 
 class TestMaxDurationEdgeCases:
     def test_max_duration_zero_keeps_session_running_until_manual_stop(self, mocker) -> None:
-        manager = _build_manager(mocker, max_duration_minutes=0)
+        manager = _build_manager(mocker, max_duration_minutes=0, sleep_fn=_no_sleep)
         manager._active_session = _active_session()
 
         def _perform_capture(_change_detection_enabled: bool) -> None:
             manager._stop_event.set()
 
         manager._perform_capture = _perform_capture
-        mocker.patch("src.services.monitoring_session_manager.time.sleep", side_effect=lambda _s: None)
 
         manager._capture_loop()
 
@@ -1,8 +1,13 @@
 """Integration tests for /vision.area command with mocked service boundary."""
 
+from __future__ import annotations
+
+from typing import Any
+
 import pytest
 from click.testing import CliRunner
 
+from src.cli.vision_area_command import parse_coordinates, vision_area
 from src.lib.exceptions import (
     InvalidRegionError,
     RegionSelectionCancelledError,
@@ -12,145 +17,139 @@ from src.lib.exceptions import (
 from src.models.entities import CaptureRegion
 
 
-@pytest.fixture()
-def cli_runner() -> CliRunner:
-    return CliRunner()
-
-
-@pytest.fixture()
-def mocked_service(mocker):
-    service = mocker.Mock()
-    service.execute_vision_area_command.return_value = "Area response"
-    return service
+class _StubService:
+    """Records execute_vision_area_command calls and replays a fixed sequence of results (values or exceptions)."""
 
+    def __init__(self, *results: str | Exception) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self._results = iter(results or ("Area response",))
 
-def test_vision_area_requires_service_when_context_missing(cli_runner: CliRunner) -> None:
-    from src.cli.vision_area_command import vision_area
+    def execute_vision_area_command(self, **kwargs: Any) -> str:
+        self.calls.append(kwargs)
+        result = next(self._results)
+        if isinstance(result, Exception):
+            raise result
+        return result
 
-    result = cli_runner.invoke(vision_area, ["Prompt"])
-
-    assert result.exit_code != 0
-    assert "Vision service not initialized" in result.output
 
+@pytest.fixture()
+def stub_service() -> _StubService:
+    return _StubService()
 
-def test_vision_area_with_coords_calls_service(cli_runner: CliRunner, mocked_service, mocker) -> None:
-    from src.cli.vision_area_command import vision_area
 
-    mocker.patch("src.cli.vision_area_command.click.echo")
+def test_vision_area_with_coords_calls_service(cli_runner: CliRunner, stub_service) -> None:
     result = cli_runner.invoke(
         vision_area,
         ["--coords", "100,120,400,300", "--monitor", "1", "What is here?"],
-        obj={"vision_service": mocked_service},
+        obj={"vision_service": stub_service},
     )
 
     assert result.exit_code == 0
-    call = mocked_service.execute_vision_area_command.call_args
-    assert call.kwargs["prompt"] == "What is here?"
-    region = call.kwargs["region"]
+    (call,) = stub_service.calls
+    assert call["prompt"] == "What is here?"
+    region = call["region"]
     assert isinstance(region, CaptureRegion)
     assert (region.x, region.y, region.width, region.height, region.monitor) == (100, 120, 400, 300, 1)
     assert region.selection_method == "coordinates"
 
 
-@pytest.mark.parametrize("bad_coords", ["100,100", "x,y,w,h", "100,100,0", "100"])
-def test_vision_area_invalid_coords_are_rejected(
-    cli_runner: CliRunner, mocked_service, bad_coords: str
-) -> None:
-    from src.cli.vision_area_command import vision_area
+@pytest.mark.parametrize(
+    "bad_coords",
+    ["100,100", "x,y,w,h", "100,100,0", "100", "-100,100,800,600", "0,0,0,600", "0,0,800,-1", "1," * 40 + "1"],
+)
+def test_parse_coordinates_rejects_malformed_input(bad_coords: str) -> None:
+    # Pure parser check; the full command path is covered once below
+    with pytest.raises(ValueError, match="Invalid coordinates format"):
+        parse_coordinates(bad_coords)
+
+
+@pytest.mark.parametrize(
+    ("coords", "expected"),
+    [
+        ("0,0,800,600", (0, 0, 800, 600)),
+        ("100,100,500,400", (100, 100, 500, 400)),
+        ("1920,0,1920,1080", (1920, 0, 1920, 1080)),
+        (" 100 , 120 ,400, 300 ", (100, 120, 400, 300)),
+    ],
+    ids=["origin", "offset", "second-monitor", "whitespace"],
+)
+def test_parse_coordinates_accepts_valid_input(coords: str, expected: tuple) -> None:
+    assert parse_coordinates(coords) == expected
+
 
+def test_vision_area_invalid_coords_are_rejected(cli_runner: CliRunner, stub_service) -> None:
     result = cli_runner.invoke(
         vision_area,
-        ["--coords", bad_coords, "Prompt"],
-        obj={"vision_service": mocked_service},
+        ["--coords", "x,y,w,h", "Prompt"],
+        obj={"vision_service": stub_service},
     )
 
     assert result.exit_code != 0
     assert "Invalid coordinates format" in result.output
-    mocked_service.execute_vision_area_command.assert_not_called()
+    assert stub_service.calls == []
 
 
 def test_vision_area_without_coords_passes_none_region(
-    cli_runner: CliRunner, mocked_service
+    cli_runner: CliRunner, stub_service
 ) -> None:
-    from src.cli.vision_area_command import vision_area
-
     result = cli_runner.invoke(
         vision_area,
         ["Prompt"],
-        obj={"vision_service": mocked_service},
+        obj={"vision_service": stub_service},
     )
 
     assert result.exit_code == 0
-    mocked_service.execute_vision_area_command.assert_called_once_with(prompt="Prompt", region=None)
+    assert stub_service.calls == [{"prompt": "Prompt", "region": None}]
 
 
-def test_vision_area_fallback_to_manual_coords_when_selection_fails(
-    cli_runner: CliRunner, mocked_service, mocker
-) -> None:
-    from src.cli.vision_area_command import vision_area
-
-    mocked_service.execute_vision_area_command.side_effect = [
-        SelectionToolNotFoundError("slurp not found"),
-        "Recovered by fallback",
-    ]
+def test_vision_area_fallback_to_manual_coords_when_selection_fails(cli_runner: CliRunner, mocker) -> None:
+    service = _StubService(SelectionToolNotFoundError("slurp not found"), "Recovered by fallback")
     mocker.patch("src.cli.vision_area_command.click.confirm", return_value=True)
     mocker.patch("src.cli.vision_area_command.click.prompt", return_value="10,20,300,200")
 
     result = cli_runner.invoke(
         vision_area,
         ["Prompt"],
-        obj={"vision_service": mocked_service},
+        obj={"vision_service": service},
     )
 
     assert result.exit_code == 0
-    assert mocked_service.execute_vision_area_command.call_count == 2
-    retry_region = mocked_service.execute_vision_area_command.call_args_list[1].kwargs["region"]
+    assert len(service.calls) == 2
+    assert service.calls[0]["region"] is None
+    retry_region = service.calls[1]["region"]
     assert isinstance(retry_region, CaptureRegion)
     assert (retry_region.x, retry_region.y, retry_region.width, retry_region.height) == (10, 20, 300, 200)
 
 
-def test_vision_area_fallback_cancel_aborts(cli_runner: CliRunner, mocked_service, mocker) -> None:
-    from src.cli.vision_area_command import vision_area
-
-    mocked_service.execute_vision_area_command.side_effect = RegionSelectionCancelledError()
+def test_vision_area_fallback_cancel_aborts(cli_runner: CliRunner, mocker) -> None:
     mocker.patch("src.cli.vision_area_command.click.confirm", return_value=False)
 
     result = cli_runner.invoke(
         vision_area,
         ["Prompt"],
-        obj={"vision_service": mocked_service},
+        obj={"vision_service": _StubService(RegionSelectionCancelledError())},
     )
 
     assert result.exit_code != 0
     assert "Operation cancelled" in result.output
 
 
-def test_vision_area_vision_command_error_is_actionable(
-    cli_runner: CliRunner, mocked_service
-) -> None:
-    from src.cli.vision_area_command import vision_area
-
-    mocked_service.execute_vision_area_command.side_effect = VisionCommandError("bad workflow")
+def test_vision_area_vision_command_error_is_actionable(cli_runner: CliRunner) -> None:
     result = cli_runner.invoke(
         vision_area,
         ["Prompt"],
-        obj={"vision_service": mocked_service},
+        obj={"vision_service": _StubService(VisionCommandError("bad workflow"))},
     )
 
     assert result.exit_code != 0
     assert "Error: bad workflow" in result.output
 
 
-def test_vision_area_invalid_region_error_is_actionable(
-    cli_runner: CliRunner, mocked_service
-) -> None:
-    from src.cli.vision_area_command import vision_area
-
-    mocked_service.execute_vision_area_command.side_effect = InvalidRegionError("out of bounds")
+def test_vision_area_invalid_region_error_is_actionable(cli_runner: CliRunner) -> None:
     result = cli_runner.invoke(
         vision_area,
         ["Prompt"],
-        obj={"vision_service": mocked_service},
+        obj={"vision_service": _StubService(InvalidRegionError("out of bounds"))},
     )
 
     assert result.exit_code != 0
@@ -2,41 +2,15 @@
 
 from uuid import uuid4
 
-import pytest
 from click.testing import CliRunner
 
+from src.cli.vision_auto_command import vision_auto
+from src.cli.vision_stop_command import vision_stop
 from src.lib.exceptions import SessionAlreadyActiveError, VisionCommandError
 
 
-@pytest.fixture()
-def cli_runner() -> CliRunner:
-    return CliRunner()
-
-
-def test_vision_auto_requires_service_when_context_missing(cli_runner: CliRunner) -> None:
-    """Command should fail with actionable message when service is unavailable."""
-    from src.cli.vision_auto_command import vision_auto
-
-    result = cli_runner.invoke(vision_auto, ["--interval", "5"])
-
-    assert result.exit_code != 0
-    assert "Vision service not initialized" in result.output
-
-
-def test_vision_stop_requires_service_when_context_missing(cli_runner: CliRunner) -> None:
-    """Stop command should fail with actionable message when service is unavailable."""
-    from src.cli.vision_stop_command import vision_stop
-
-    result = cli_runner.invoke(vision_stop, [])
-
-    assert result.exit_code != 0
-    assert "Vision service not initialized" in result.output
-
-
 def test_vision_auto_starts_monitoring_session(cli_runner: CliRunner, mocker) -> None:
     """Starts session and prints returned session id."""
-    from src.cli.vision_auto_command import vision_auto
-
     session_id = uuid4()
     vision_service = mocker.Mock()
     vision_service.execute_vision_auto_command.return_value = session_id
@@ -54,9 +28,7 @@ def test_vision_auto_starts_monitoring_session(cli_runner: CliRunner, mocker) ->
 
 
 def test_vision_auto_rejects_nonpositive_interval(cli_runner: CliRunner, mocker) -> None:
-    """Validates interval before invoking service."""
-    from src.cli.vision_auto_command import vision_auto
-
+    """Click rejects the interval during parsing, before the service is touched."""
     vision_service = mocker.Mock()
     result = cli_runner.invoke(
         vision_auto,
@@ -64,15 +36,13 @@ def test_vision_auto_rejects_nonpositive_interval(cli_runner: CliRunner, mocker)
         obj={"vision_service": vision_service},
     )
 
-    assert result.exit_code != 0
-    assert "Interval must be positive" in result.output
+    assert result.exit_code == 2
+    assert "Invalid value for '--interval'" in result.output
     vision_service.execute_vision_auto_command.assert_not_called()
 
 
 def test_vision_auto_handles_active_session_error(cli_runner: CliRunner, mocker) -> None:
     """Shows friendly guidance when session is already active."""
-    from src.cli.vision_auto_command import vision_auto
-
     vision_service = mocker.Mock()
     vision_service.execute_vision_auto_command.side_effect = SessionAlreadyActiveError("already active")
 
@@ -89,8 +59,6 @@ def test_vision_auto_handles_active_session_error(cli_runner: CliRunner, mocker)
 
 def test_vision_stop_stops_active_session(cli_runner: CliRunner, mocker) -> None:
     """Stops active session and prints confirmation."""
-    from src.cli.vision_stop_command import vision_stop
-
     vision_service = mocker.Mock()
 
     result = cli_runner.invoke(
@@ -106,8 +74,6 @@ def test_vision_stop_stops_active_session(cli_runner: CliRunner, mocker) -> None
 
 def test_vision_stop_handles_no_active_session_error(cli_runner: CliRunner, mocker) -> None:
     """Shows actionable guidance when there is no active session."""
-    from src.cli.vision_stop_command import vision_stop
-
     vision_service = mocker.Mock()
     vision_service.execute_vision_stop_command.side_effect = VisionCommandError(
         "No active monitoring session to stop"
@@ -3,6 +3,7 @@
 import pytest
 from click.testing import CliRunner
 
+from src.cli.vision_command import vision
 from src.lib.exceptions import (
     AuthenticationError,
     ConfigurationError,
@@ -14,11 +15,6 @@ from src.lib.exceptions import (
 from src.models.entities import Configuration
 
 
-@pytest.fixture()
-def cli_runner() -> CliRunner:
-    return CliRunner()
-
-
 @pytest.fixture()
 def mocked_service(mocker):
     service = mocker.Mock()
@@ -28,8 +24,6 @@ def mocked_service(mocker):
 
 
 def test_vision_command_success(cli_runner: CliRunner, mocked_service, mocker) -> None:
-    from src.cli.vision_command import vision
-
     mocker.patch("src.cli.vision_command.get_vision_service", return_value=mocked_service)
     result = cli_runner.invoke(vision, ["What do you see?"])
 
@@ -41,8 +35,6 @@ def test_vision_command_success(cli_runner: CliRunner, mocked_service, mocker) -
 
 
 def test_vision_command_supports_long_prompt(cli_runner: CliRunner, mocked_service, mocker) -> None:
-    from src.cli.vision_command import vision
-
     mocker.patch("src.cli.vision_command.get_vision_service", return_value=mocked_service)
     long_prompt = "analyze " * 120
     result = cli_runner.invoke(vision, [long_prompt])
@@ -52,8 +44,6 @@ def test_vision_command_supports_long_prompt(cli_runner: CliRunner, mocked_servi
 
 
 def test_vision_command_supports_empty_prompt(cli_runner: CliRunner, mocked_service, mocker) -> None:
-    from src.cli.vision_command import vision
-
     mocker.patch("src.cli.vision_command.get_vision_service", return_value=mocked_service)
     result = cli_runner.invoke(vision, [""])
 
@@ -64,8 +54,6 @@ def test_vision_command_supports_empty_prompt(cli_runner: CliRunner, mocked_serv
 def test_vision_command_overrides_monitor_from_flag(
     cli_runner: CliRunner, mocked_service, mocker
 ) -> None:
-    from src.cli.vision_command import vision
-
     cfg = Configuration()
     cfg.monitors.default = 0
     mocked_service.config_manager.load_config.return_value = cfg
@@ -91,8 +79,6 @@ def test_vision_command_overrides_monitor_from_flag(
 def test_vision_command_actionable_errors(
     cli_runner: CliRunner, mocked_service, mocker, error: Exception, expected_text: str
 ) -> None:
-    from src.cli.vision_command import vision
-
     mocked_service.execute_vision_command.side_effect = error
     mocker.patch("src.cli.vision_command.get_vision_service", return_value=mocked_service)
     result = cli_runner.invoke(vision, ["Prompt"])
@@ -102,8 +88,6 @@ def test_vision_command_actionable_errors(
 
 
 def test_vision_command_handles_unexpected_errors(cli_runner: CliRunner, mocked_service, mocker) -> None:
-    from src.cli.vision_command import vision
-
     mocked_service.execute_vision_command.side_effect = RuntimeError("boom")
     mocker.patch("src.cli.vision_command.get_vision_service", return_value=mocked_service)
     result = cli_runner.invoke(vision, ["Prompt"])
@@ -113,11 +97,19 @@ def test_vision_command_handles_unexpected_errors(cli_runner: CliRunner, mocked_
 
 
 def test_vision_command_handles_keyboard_interrupt(cli_runner: CliRunner, mocked_service, mocker) -> None:
-    from src.cli.vision_command import vision
-
     mocked_service.execute_vision_command.side_effect = KeyboardInterrupt()
     mocker.patch("src.cli.vision_command.get_vision_service", return_value=mocked_service)
     result = cli_runner.invoke(vision, ["Prompt"])
 
     assert result.exit_code == 130
     assert "Interrupted by user" in result.output
+
+
+def test_vision_command_closes_service_after_failure(cli_runner: CliRunner, mocked_service, mocker) -> None:
+    mocked_service.execute_vision_command.side_effect = VisionCommandError("failed")
+    mocker.patch("src.cli.vision_command.get_vision_service", return_value=mocked_service)
+
+    result = cli_runner.invoke(vision, ["Prompt"])
+
+    assert result.exit_code == 1
+    mocked_service.close.assert_called_once_with()
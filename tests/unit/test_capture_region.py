@@ -311,3 +311,13 @@ class TestCaptureRegionEdgeCases:
         # Should fail with smaller monitor
         with pytest.raises(ValueError):
             region.validate(monitor_width=800, monitor_height=600)
+
+    def test_validate_raw_returns_none_for_valid_region(self):
+        """Test raw validation accepts a region that fits the monitor."""
+        assert CaptureRegion.validate_raw(0, 0, 1920, 1080, monitor_width=1920, monitor_height=1080) is None
+
+    def test_validate_raw_returns_first_error_message(self):
+        """Test raw validation reports the same message validate() raises."""
+        error = CaptureRegion.validate_raw(-1, 0, 0, 100, monitor_width=1920, monitor_height=1080)
+
+        assert error == "Coordinates must be non-negative"
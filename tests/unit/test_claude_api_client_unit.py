@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 import json
 from datetime import UTC, datetime
 from pathlib import Path
@@ -91,7 +92,7 @@ def test_send_multimodal_prompt_raises_for_unauthorized(
     def _post(*_args, **_kwargs):
         return SimpleNamespace(status_code=401, text="unauthorized", json=lambda: {})
 
-    monkeypatch.setattr("src.services.claude_api_client.requests.post", _post)
+    monkeypatch.setattr("src.services.claude_api_client.requests.Session.post", _post)
 
     with pytest.raises(AuthenticationError):
         client.send_multimodal_prompt("hello", sample_screenshot)
@@ -106,7 +107,7 @@ def test_send_multimodal_prompt_raises_for_payload_too_large(
     def _post(*_args, **_kwargs):
         return SimpleNamespace(status_code=413, text="too large", json=lambda: {})
 
-    monkeypatch.setattr("src.services.claude_api_client.requests.post", _post)
+    monkeypatch.setattr("src.services.claude_api_client.requests.Session.post", _post)
 
     with pytest.raises(PayloadTooLargeError):
         client.send_multimodal_prompt("hello", sample_screenshot)
@@ -121,7 +122,7 @@ def test_send_multimodal_prompt_raises_api_error_on_non_200(
     def _post(*_args, **_kwargs):
         return SimpleNamespace(status_code=500, text="boom", json=lambda: {})
 
-    monkeypatch.setattr("src.services.claude_api_client.requests.post", _post)
+    monkeypatch.setattr("src.services.claude_api_client.requests.Session.post", _post)
 
     with pytest.raises(APIError, match="API request failed: 500"):
         client.send_multimodal_prompt("hello", sample_screenshot)
@@ -136,7 +137,7 @@ def test_send_multimodal_prompt_raises_on_timeout(
     def _post(*_args, **_kwargs):
         raise requests.exceptions.Timeout()
 
-    monkeypatch.setattr("src.services.claude_api_client.requests.post", _post)
+    monkeypatch.setattr("src.services.claude_api_client.requests.Session.post", _post)
 
     with pytest.raises(APIError, match="timed out"):
         client.send_multimodal_prompt("hello", sample_screenshot)
@@ -155,8 +156,75 @@ def test_send_multimodal_prompt_returns_response_text(
             json=lambda: {"content": [{"text": "analysis result"}]},
         )
 
-    monkeypatch.setattr("src.services.claude_api_client.requests.post", _post)
+    monkeypatch.setattr("src.services.claude_api_client.requests.Session.post", _post)
 
     response = client.send_multimodal_prompt("hello", sample_screenshot)
 
     assert response == "analysis result"
+
+
+def test_warm_connection_swallows_request_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = AnthropicAPIClient(api_key="sk-test")
+    calls = []
+
+    def _head(*_args, **kwargs):
+        calls.append(kwargs)
+        raise requests.exceptions.ConnectionError()
+
+    monkeypatch.setattr("src.services.claude_api_client.requests.Session.head", _head)
+
+    client.warm_connection()
+
+    assert calls == [{"timeout": AnthropicAPIClient.WARM_TIMEOUT_SECONDS}]
+
+
+
+def test_warm_connection_skips_after_first_success(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = AnthropicAPIClient(api_key="sk-test")
+    calls = []
+    monkeypatch.setattr(
+        "src.services.claude_api_client.requests.Session.head", lambda *_args, **_kwargs: calls.append(1)
+    )
+
+    client.warm_connection()
+    client.warm_connection()
+
+    assert calls == [1]
+
+def test_encode_image_base64_matches_file_contents(sample_screenshot: Screenshot) -> None:
+    client = AnthropicAPIClient(api_key="sk-test")
+
+    encoded = client._encode_image_base64(sample_screenshot)
+
+    assert base64.standard_b64decode(encoded) == sample_screenshot.file_path.read_bytes()
+
+
+def test_encode_image_base64_raises_api_error_for_empty_file(tmp_path: Path, sample_screenshot: Screenshot) -> None:
+    empty_path = tmp_path / "empty.png"
+    empty_path.write_bytes(b"")
+    sample_screenshot.file_path = empty_path
+    client = AnthropicAPIClient(api_key="sk-test")
+
+    with pytest.raises(APIError, match="Failed to encode image"):
+        client._encode_image_base64(sample_screenshot)
+
+
+def test_send_multimodal_prompt_posts_serialized_json_body(
+    monkeypatch: pytest.MonkeyPatch,
+    sample_screenshot: Screenshot,
+) -> None:
+    client = AnthropicAPIClient(api_key="sk-test")
+    captured = {}
+
+    def _post(*_args, **kwargs):
+        captured.update(kwargs)
+        return SimpleNamespace(status_code=200, text="ok", json=lambda: {"content": [{"text": "ok"}]})
+
+    monkeypatch.setattr("src.services.claude_api_client.requests.Session.post", _post)
+
+    client.send_multimodal_prompt("hello", sample_screenshot)
+
+    body = json.loads(captured["data"])
+    assert "json" not in captured
+    assert captured["headers"]["content-type"] == "application/json"
+    assert body["messages"][0]["content"][1]["text"] == "hello"
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 import pytest
+import yaml
 
 from src.lib.exceptions import ConfigurationError
 from src.models.entities import Configuration, PrivacyZone
@@ -145,6 +147,30 @@ def test_validate_config_raises_with_multiple_errors(manager: ConfigurationManag
     assert "logging.level must be DEBUG, INFO, WARNING, or ERROR" in message
 
 
+def test_load_config_normalizes_provider_case(manager: ConfigurationManager, config_path: Path) -> None:
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    config_path.write_text("ai_provider:\n  provider: Claude\n", encoding="utf-8")
+
+    config = manager.load_config()
+
+    assert config.ai_provider.provider == "claude"
+
+
+def test_validate_config_rejects_unknown_provider(manager: ConfigurationManager) -> None:
+    config = Configuration()
+    config.ai_provider.provider = "openai"
+
+    with pytest.raises(ConfigurationError, match=re.escape("ai_provider.provider must be 'claude' or 'gemini'")):
+        manager.validate_config(config)
+
+
+def test_validate_config_accepts_provider_assigned_in_mixed_case(manager: ConfigurationManager) -> None:
+    config = Configuration()
+    config.ai_provider.provider = "Gemini"
+
+    assert manager.validate_config(config) is True
+
+
 def test_validate_config_raises_for_invalid_privacy_zone(manager: ConfigurationManager) -> None:
     config = Configuration()
     config.privacy.zones = [PrivacyZone(name="bad", x=-1, y=0, width=0, height=1, monitor=0)]
@@ -183,3 +209,70 @@ def test_config_to_dict_contains_expected_sections(manager: ConfigurationManager
     assert "logging" in as_dict
     assert "ai_provider" in as_dict
     assert "gemini" in as_dict
+
+
+def test_save_config_round_trips_through_safe_yaml(manager: ConfigurationManager, config_path: Path) -> None:
+    config = Configuration()
+    config.privacy.zones = [PrivacyZone(name="pw", x=1, y=2, width=30, height=40)]
+    manager.save_config(config)
+
+    assert "!!python" not in config_path.read_text(encoding="utf-8")
+    loaded = manager.load_config()
+    assert loaded.privacy.zones[0].name == "pw"
+    assert loaded.privacy.zones[0].width == 30
+
+
+def test_load_config_reuses_parse_while_file_unchanged(
+    manager: ConfigurationManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    manager.save_config(Configuration())
+    manager.clear_cache()
+    parses = []
+    real_load = yaml.load
+    monkeypatch.setattr(yaml, "load", lambda *args, **kwargs: parses.append(1) or real_load(*args, **kwargs))
+
+    first = manager.load_config()
+    first.screenshot.quality = 10
+    second = manager.load_config()
+
+    assert len(parses) == 1
+    assert second.screenshot.quality == 85
+    assert second is not first
+
+
+def test_load_config_reparses_after_external_edit(manager: ConfigurationManager, config_path: Path) -> None:
+    manager.save_config(Configuration())
+    assert manager.load_config().screenshot.quality == 85
+
+    config_path.write_text("screenshot:\n  quality: 55\n", encoding="utf-8")
+
+    assert manager.load_config().screenshot.quality == 55
+
+
+def test_save_config_refreshes_cached_configuration(manager: ConfigurationManager) -> None:
+    config = Configuration()
+    config.monitoring.interval_seconds = 12
+    manager.save_config(config)
+    config.monitoring.interval_seconds = 99
+
+    assert manager.load_config().monitoring.interval_seconds == 12
+
+
+def test_clear_cache_forces_reparse(manager: ConfigurationManager, monkeypatch: pytest.MonkeyPatch) -> None:
+    manager.save_config(Configuration())
+    parses = []
+    real_load = yaml.load
+    monkeypatch.setattr(yaml, "load", lambda *args, **kwargs: parses.append(1) or real_load(*args, **kwargs))
+
+    manager.load_config()
+    manager.clear_cache()
+    manager.load_config()
+
+    assert len(parses) == 1
+
+
+def test_load_and_save_leave_only_config_file(manager: ConfigurationManager, config_path: Path) -> None:
+    manager.save_config(Configuration())
+    ConfigurationManager(config_path=config_path).load_config()
+
+    assert [p.name for p in config_path.parent.iterdir()] == [config_path.name]
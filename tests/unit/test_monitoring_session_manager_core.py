@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import subprocess
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from types import SimpleNamespace
@@ -64,8 +65,7 @@ def screenshot(tmp_path: Path) -> Screenshot:
     )
 
 
-@pytest.fixture()
-def manager(mocker, config: Configuration) -> MonitoringSessionManager:
+def _build_manager(mocker, config: Configuration, **time_hooks) -> MonitoringSessionManager:
     config_manager = mocker.Mock()
     config_manager.load_config.return_value = config
 
@@ -76,9 +76,15 @@ def manager(mocker, config: Configuration) -> MonitoringSessionManager:
         processor=mocker.Mock(),
         api_client=mocker.Mock(),
         idle_seconds_provider=lambda: None,
+        **time_hooks,
     )
 
 
+@pytest.fixture()
+def manager(mocker, config: Configuration) -> MonitoringSessionManager:
+    return _build_manager(mocker, config)
+
+
 def test_start_session_uses_default_interval_when_none(monkeypatch: pytest.MonkeyPatch, manager: MonitoringSessionManager) -> None:
     monkeypatch.setattr("src.services.monitoring_session_manager.threading.Thread", _FakeThread)
 
@@ -176,24 +182,35 @@ def test_capture_loop_stops_when_max_duration_reached(manager: MonitoringSession
     assert manager._active_session.is_active is False
 
 
-def test_capture_loop_skips_capture_when_paused(
-    manager: MonitoringSessionManager,
-    config: Configuration,
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    session = MonitoringSession(id=uuid4(), started_at=datetime.now(tz=UTC), interval_seconds=1)
-    session.paused_at = datetime.now(tz=UTC)
-    manager._active_session = session
-    manager.config_manager.load_config.return_value = config
+def test_capture_loop_skips_capture_when_paused(mocker, config: Configuration) -> None:
+    sleeps: list[float] = []
 
-    def _sleep(_seconds: float) -> None:
+    def _sleep(seconds: float) -> None:
+        sleeps.append(seconds)
         manager._stop_event.set()
 
-    monkeypatch.setattr("src.services.monitoring_session_manager.time.sleep", _sleep)
+    manager = _build_manager(mocker, config, sleep_fn=_sleep)
+    session = MonitoringSession(id=uuid4(), started_at=datetime.now(tz=UTC), interval_seconds=1)
+    session.paused_at = datetime.now(tz=UTC)
+    manager._active_session = session
 
     manager._capture_loop()
 
     manager.capture.capture_full_screen.assert_not_called()
+    assert sleeps == [1]
+
+
+def test_time_hooks_default_to_time_module_and_accept_injection(mocker) -> None:
+    dependencies = {name: mocker.Mock() for name in ("config_manager", "temp_manager", "capture", "processor", "api_client")}
+    sleep_fn, clock = mocker.Mock(), mocker.Mock()
+
+    default = MonitoringSessionManager(**dependencies)
+    injected = MonitoringSessionManager(**dependencies, sleep_fn=sleep_fn, clock=clock)
+
+    assert default._sleep_fn is time.sleep
+    assert default._clock is time.monotonic
+    assert injected._sleep_fn is sleep_fn
+    assert injected._clock is clock
 
 
 def test_perform_capture_returns_when_no_active_session(manager: MonitoringSessionManager, config: Configuration) -> None:
@@ -304,3 +321,33 @@ def test_get_system_idle_seconds_handles_parse_and_subprocess_errors(
 
     monkeypatch.setattr("src.services.monitoring_session_manager.subprocess.run", _raise)
     assert manager._get_system_idle_seconds() is None
+
+
+def test_default_idle_provider_caches_system_query(mocker) -> None:
+    dependencies = {name: mocker.Mock() for name in ("config_manager", "temp_manager", "capture", "processor", "api_client")}
+    now = [100.0]
+    manager = MonitoringSessionManager(**dependencies, clock=lambda: now[0])
+    query = mocker.patch.object(manager, "_get_system_idle_seconds", side_effect=[1.0, 7.0])
+
+    assert manager._idle_seconds_provider() == 1.0
+    now[0] += MonitoringSessionManager.IDLE_QUERY_CACHE_SECONDS - 0.5
+    assert manager._idle_seconds_provider() == 1.0
+    now[0] += 1.0
+    assert manager._idle_seconds_provider() == 7.0
+    assert query.call_count == 2
+
+
+def test_idle_query_cache_is_shorter_for_short_intervals(mocker) -> None:
+    dependencies = {name: mocker.Mock() for name in ("config_manager", "temp_manager", "capture", "processor", "api_client")}
+    now = [100.0]
+    manager = MonitoringSessionManager(**dependencies, clock=lambda: now[0])
+    manager._active_session = MonitoringSession(id=uuid4(), started_at=datetime.now(tz=UTC), interval_seconds=2)
+    query = mocker.patch.object(manager, "_get_system_idle_seconds", side_effect=[1.0, 3.0])
+
+    assert manager._idle_seconds_provider() == 1.0
+    now[0] += 0.5
+    assert manager._idle_seconds_provider() == 1.0
+    # Half the 2s interval has passed, well inside IDLE_QUERY_CACHE_SECONDS
+    now[0] += 0.5
+    assert manager._idle_seconds_provider() == 3.0
+    assert query.call_count == 2
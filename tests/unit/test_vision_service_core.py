@@ -1,5 +1,6 @@
 """Unit tests for core VisionService orchestration behavior."""
 
+import threading
 from uuid import uuid4
 
 import pytest
@@ -61,6 +62,15 @@ def test_get_api_client_raises_when_no_client_available(mocker) -> None:
         service._get_api_client()
 
 
+def test_get_api_client_normalizes_provider_assigned_after_load(mocker) -> None:
+    config = Configuration()
+    service = _build_service(mocker, config=config)
+    config.ai_provider.provider = "Claude"
+    config.ai_provider.fallback_to_gemini = False
+
+    assert service._get_api_client() is service.claude_client
+
+
 def test_execute_vision_auto_uses_config_interval(mocker) -> None:
     config = Configuration()
     config.monitoring.interval_seconds = 42
@@ -92,3 +102,116 @@ def test_execute_vision_stop_without_active_session_is_actionable(mocker) -> Non
         service.execute_vision_stop_command()
 
     service.session_manager.stop_session.assert_not_called()
+
+
+def test_get_api_client_caches_decision_while_provider_unchanged(mocker) -> None:
+    config = Configuration()
+    config.ai_provider.provider = "gemini"
+    service = _build_service(mocker, config=config)
+    select = mocker.spy(service, "_select_api_client")
+
+    first = service._get_api_client()
+    second = service._get_api_client()
+
+    assert first is second is service.gemini_client
+    select.assert_called_once()
+
+    config.ai_provider.provider = "claude"
+
+    assert service._get_api_client() is service.claude_client
+    assert select.call_count == 2
+
+
+def test_execute_vision_command_warms_connection_before_sending(mocker) -> None:
+    config = Configuration()
+    config.privacy.prompt_first_use = False
+    service = _build_service(mocker, config=config)
+    service.processor.optimize_image.return_value.optimized_size_bytes = 1024
+    order = []
+    service.gemini_client.warm_connection.side_effect = lambda: order.append("warm")
+    service.gemini_client.send_multimodal_prompt.side_effect = lambda *_args: order.append("send") or "ok"
+
+    assert service.execute_vision_command("hello") == "ok"
+    assert order == ["warm", "send"]
+
+
+
+def test_execute_vision_command_sends_without_waiting_for_stalled_warm_up(mocker) -> None:
+    config = Configuration()
+    config.privacy.prompt_first_use = False
+    service = _build_service(mocker, config=config)
+    service.WARM_WAIT_SECONDS = 0.01
+    service.processor.optimize_image.return_value.optimized_size_bytes = 1024
+    release = threading.Event()
+    service.gemini_client.warm_connection.side_effect = lambda: release.wait(5)
+    service.gemini_client.send_multimodal_prompt.return_value = "ok"
+
+    try:
+        assert service.execute_vision_command("hello") == "ok"
+        assert not release.is_set()
+    finally:
+        release.set()
+        service.close()
+
+
+def test_commands_without_warm_up_start_no_executor(mocker) -> None:
+    service = _build_service(mocker)
+    session = MonitoringSession(id=uuid4(), started_at=mocker.Mock(), interval_seconds=30)
+    service.session_manager.start_session.return_value = session
+    service.session_manager.get_active_session.return_value = session
+
+    service.execute_vision_auto_command(interval_seconds=None)
+    service.execute_vision_stop_command()
+
+    assert service._executor is None
+    service.close()
+
+def test_execute_vision_command_does_not_rewrap_vision_command_error(mocker) -> None:
+    service = _build_service(mocker)
+    declined = VisionCommandError("Privacy terms not accepted. Vision command cancelled.")
+    mocker.patch.object(service, "_check_first_use_prompt", side_effect=declined)
+
+    with pytest.raises(VisionCommandError) as exc_info:
+        service.execute_vision_command("hello")
+
+    assert exc_info.value is declined
+    service.capture.capture_full_screen.assert_not_called()
+
+
+
+def test_execute_vision_command_lets_programming_errors_propagate(mocker) -> None:
+    config = Configuration()
+    config.privacy.prompt_first_use = False
+    service = _build_service(mocker, config=config)
+    service.capture.capture_full_screen.side_effect = TypeError("bad call")
+
+    with pytest.raises(TypeError, match="bad call"):
+        service.execute_vision_command("hello")
+
+def test_execute_vision_command_cleans_up_before_returning(mocker) -> None:
+    config = Configuration()
+    config.privacy.prompt_first_use = False
+    service = _build_service(mocker, config=config)
+    service.processor.optimize_image.return_value.optimized_size_bytes = 1024
+    service.gemini_client.send_multimodal_prompt.return_value = "ok"
+
+    assert service.execute_vision_command("hello") == "ok"
+
+    service.temp_manager.cleanup_temp_file.assert_called_once_with(
+        service.processor.optimize_image.return_value.file_path
+    )
+
+
+def test_execute_vision_command_reports_missing_client_after_processing(mocker) -> None:
+    config = Configuration()
+    config.privacy.prompt_first_use = False
+    config.ai_provider.fallback_to_gemini = False
+    service = _build_service(mocker, config=config)
+    service.processor.optimize_image.return_value.optimized_size_bytes = 1024
+    service.claude_client = None
+    service.gemini_client = None
+
+    with pytest.raises(VisionCommandError, match="No API client available"):
+        service.execute_vision_command("hello")
+
+    service.processor.optimize_image.assert_called_once()